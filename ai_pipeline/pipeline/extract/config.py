@@ -3,6 +3,12 @@
 import json
 from typing import Any, Dict, Union
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class Config:
     def __init__(self, config_source: Union[str, Dict[str, Any]]):
         if isinstance(config_source, str):
@@ -17,8 +23,8 @@ class Config:
         
     def _load_config_from_file(self, config_path: str) -> Dict[str, Any]:
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return _json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading config from '{config_path}': {e}")
             return {}
@@ -27,6 +33,10 @@ class Config:
     def nlp_model(self) -> str:
         return self._config_data.get("nlp", {}).get("spacy_model", "en_core_web_sm")
     
+    @property
+    def fast_text(self) -> bool:
+        return self._config_data.get("extraction", {}).get("fast_text", True)
+
     @property
     def chunking_config(self) -> Dict[str, Any]:
         return self._config_data.get("chunking", {"size": 13000, "overlap": 400})
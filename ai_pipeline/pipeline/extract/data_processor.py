@@ -1,7 +1,26 @@
 # ai_pipeline/pipeline/extract/data_processor.py
 
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+
+from .fast_clean import HAS_FAST_CLEAN, clean_markdown_fast
+
+_RE_IMG = re.compile(r"<!--\s*image\s*-->", re.IGNORECASE)
+_RE_MULTISPACE = re.compile(r"[ ]{2,}")
+_RE_MULTINL = re.compile(r"\n{3,}")
+_RE_TRAILWS = re.compile(r"[ \t]+\n")
+# Below this size the compiled path's encode/decode overhead outweighs its gain
+_FAST_CLEAN_MIN_LENGTH = 65536
+
+class _CleanTable(dict):
+    # Anything outside tab/newline/CR and printable ASCII becomes a space,
+    # so bullets and non-printables are handled in one translate pass.
+    def __missing__(self, codepoint: int) -> str:
+        self[codepoint] = " "
+        return " "
+
+_TRANSLATE = _CleanTable({c: c for c in (0x09, 0x0A, 0x0D, *range(0x20, 0x7F))})
+_TRANSLATE.update(str.maketrans({"·": "- ", "•": "- ", "○": "- "}))
 
 class TextProcessor:
     def __init__(self, chunking_config: Dict[str, Any]):
@@ -11,21 +30,24 @@ class TextProcessor:
     def clean_markdown(self, text: str) -> str:
         if not text:
             return ""
-        text = re.sub(r"<!--\s*image\s*-->", "", text, flags=re.IGNORECASE)
-        text = text.replace("�", " ").replace("·", "- ").replace("•", "- ").replace("○", "- ") 
-        text = re.sub(r"[^\x09\x0A\x0D\x20-\x7E]", " ", text) 
-        text = re.sub(r"[ ]{2,}", " ", text).replace("\\n", "\n")
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r"[ \t]+\n", "\n", text)
+        text = _RE_IMG.sub("", text)
+        if HAS_FAST_CLEAN and len(text) > _FAST_CLEAN_MIN_LENGTH:
+            return clean_markdown_fast(text)
+        text = text.translate(_TRANSLATE)
+        text = _RE_MULTISPACE.sub(" ", text).replace("\\n", "\n")
+        text = _RE_MULTINL.sub("\n\n", text)
+        text = _RE_TRAILWS.sub("\n", text)
         return text.strip()
 
     def chunk_text(self, text: str) -> List[str]: 
         if not text:
             return []
-        chunks = []
-        start = 0
-        while start < len(text):
-            end = min(start + self.size, len(text))
-            chunks.append(text[start:end])
-            start += self.size - self.overlap
-        return chunks
+        step = self.size - self.overlap
+        return [text[i:i + self.size] for i in range(0, len(text), step)]
+
+    def iter_chunks(self, text: str) -> Iterator[str]:
+        if not text:
+            return
+        step = self.size - self.overlap
+        for i in range(0, len(text), step):
+            yield text[i:i + self.size]
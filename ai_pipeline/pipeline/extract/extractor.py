@@ -1,35 +1,112 @@
 # ai_pipeline/pipeline/extract/extractor.py
 
 import json
+import os
 import spacy
-import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Union
+from typing import Callable, List, Dict, Any, Tuple, Union
+from spacy.language import Language
 from spacy_layout import spaCyLayout
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 from .config import Config
 from .data_processor import TextProcessor
-from .file_utils import save_json, get_metadata_filename, save_metadata
+from .file_utils import save_ndjson, get_metadata_filename_from_stem, save_metadata
+
+_AUDITING_NOTES = {
+    "purpose": "To track the extraction process for quality control and debugging.",
+    "what_is_tracked": (
+        "Source type (e.g., 'file_system', 'database').",
+        "Source identifier (e.g., file path, DB ID).",
+        "Extraction parameters (chunk size, overlap, NLP model).",
+        "Success status and number of chunks generated.",
+        "Output file location.",
+        "Processing time and error messages."
+    )
+}
+
+_worker_extractor = None
+
+def _worker_init(config_source: Union[str, Dict[str, Any]]):
+    # Load the spaCy model once per worker process instead of once per file
+    global _worker_extractor
+    _worker_extractor = Extractor(config_source)
+    if not _worker_extractor.fast_text:
+        _worker_extractor._get_layout()
+
+def _worker_extract_batch(input_paths: List[str], output_dir: str, prefix: str) -> List[Dict[str, Any]]:
+    return _worker_extractor.extract_from_file_batch(input_paths, output_dir=output_dir, prefix=prefix)
 
 class Extractor:
+    _nlp_cache: Dict[str, Tuple[Language, spaCyLayout]] = {}
+    _lock = threading.Lock()
+    # Only the tokenizer/vocab is needed for layout parsing
+    _disabled_components = ["ner", "tagger", "lemmatizer", "attribute_ruler"]
+
     def __init__(self, config_source: Union[str, Dict[str, Any]]):
+        self.config_source = config_source
         self.config = Config(config_source)
         self.text_processor = TextProcessor(self.config.chunking_config)
         self.nlp_model = self.config.nlp_model
+        self.fast_text = self.config.fast_text and pdfium is not None
+
+    def _get_layout(self) -> Tuple[Language, spaCyLayout]:
+        cached = Extractor._nlp_cache.get(self.nlp_model)
+        if cached is not None:
+            return cached
+        with Extractor._lock:
+            cached = Extractor._nlp_cache.get(self.nlp_model)
+            if cached is None:
+                print(f"--- Loading spaCy model '{self.nlp_model}' for the first time. ---")
+                if self.nlp_model.startswith("blank:"):
+                    # Tokenizer-only pipeline, nothing to load from disk
+                    nlp_layout = spacy.blank(self.nlp_model.split(":", 1)[1])
+                else:
+                    nlp_layout = spacy.load(self.nlp_model, disable=Extractor._disabled_components)
+                cached = (nlp_layout, spaCyLayout(nlp_layout))
+                Extractor._nlp_cache[self.nlp_model] = cached
+        return cached
+
+    def _extract_text_fast(self, pdf_source: Union[str, bytes]) -> str:
+        # Plain page text straight from PDFium; no spaCy/Docling involved
+        try:
+            pdf = pdfium.PdfDocument(pdf_source)
+        except Exception as e:
+            print(f"Fast text extraction failed, using layout extraction: {e}")
+            return ""
+        try:
+            pages = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return "\n\n".join(pages).replace("\r\n", "\n").strip()
+        except Exception as e:
+            # A bad page should not fail the file; the layout pipeline gets a try instead
+            print(f"Fast text extraction failed, using layout extraction: {e}")
+            return ""
+        finally:
+            pdf.close()
 
     def _extract_text_from_source(self, pdf_source: Union[str, bytes]) -> str:
+        if self.fast_text:
+            text = self._extract_text_fast(pdf_source)
+            # Scanned or image-only PDFs come back empty; those still need the layout pipeline
+            if text:
+                return text
         try:
-            nlp_layout = spacy.load(self.nlp_model)
-            layout = spaCyLayout(nlp_layout)
-            if isinstance(pdf_source, bytes):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-                    tmp_pdf.write(pdf_source)
-                    tmp_pdf_path = tmp_pdf.name
-                layout_doc = layout(tmp_pdf_path)
-                Path(tmp_pdf_path).unlink()
-            else:
-                layout_doc = layout(pdf_source)
+            nlp_layout, layout = self._get_layout()
+            # spaCyLayout accepts raw bytes and wraps them in an in-memory stream
+            layout_doc = layout(pdf_source)
             return layout_doc._.markdown
         except OSError:
             print(f"Error: spaCy model '{self.nlp_model}' not found.")
@@ -39,11 +116,11 @@ class Extractor:
             print(f"Error processing PDF: {e}")
             raise
 
-    def _generate_metadata(self, source_type: str, source_id: Any, total_chunks: int, output_chunks_file: str, status: str, processing_time: float, error_message: str = None) -> Dict[str, Any]:
+    def _generate_metadata(self, source_type: str, source_id: Any, total_chunks: int, output_chunks_file: str, status: str, processing_time: float, timestamp: str, error_message: str = None) -> Dict[str, Any]:
         return {
             "source_identifier": source_id,
             "source_type": source_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp,
             "extraction_details": {
                 "status": status,
                 "total_chunks": total_chunks,
@@ -53,67 +130,56 @@ class Extractor:
                 "processing_time_seconds": round(processing_time, 2),
                 "error_message": error_message
             },
-            "auditing_notes": {
-                "purpose": "To track the extraction process for quality control and debugging.",
-                "what_is_tracked": [
-                    "Source type (e.g., 'file_system', 'database').",
-                    "Source identifier (e.g., file path, DB ID).",
-                    "Extraction parameters (chunk size, overlap, NLP model).",
-                    "Success status and number of chunks generated.",
-                    "Output file location.",
-                    "Processing time and error messages."
-                ]
-            }
+            "auditing_notes": _AUDITING_NOTES
         }
 
     def extract_from_source(self, pdf_source: Union[str, bytes], source_type: str, source_id: Any, output_dir: str = "ai_pipeline/data/output/extract", prefix: str = "chunks_") -> Dict[str, Any]:
-        start_time = datetime.now(timezone.utc)
+        return self._extract(lambda: self._extract_text_from_source(pdf_source), source_type, source_id, output_dir, prefix)
+
+    def _extract(self, load_markdown: Callable[[], str], source_type: str, source_id: Any, output_dir: str, prefix: str, conversion_time: float = 0.0) -> Dict[str, Any]:
+        # conversion_time covers PDF-to-text work done before this call (batch extraction)
+        start_time = time.monotonic() - conversion_time
+        started_at = datetime.now(timezone.utc).isoformat()
         
-        if isinstance(source_id, str):
-            source_name = Path(source_id).stem
-        else:
-            source_name = "extracted_from_bytes"
-            
-        output_filename = f"{prefix}{source_name}.json"
-        output_filepath = Path(output_dir) / output_filename
-        metadata_path = get_metadata_filename(str(source_name))
+        source_stem = Path(source_id).stem if isinstance(source_id, str) else "extracted_from_bytes"
+        output_filepath = os.path.join(output_dir, f"{prefix}{source_stem}.jsonl")
+        metadata_path = get_metadata_filename_from_stem(source_stem)
 
         try:
             print(f"Memproses sumber dengan ID: {source_id} (dari tipe: {source_type})")
-            raw_markdown = self._extract_text_from_source(pdf_source)
+            raw_markdown = load_markdown()
             cleaned_markdown = self.text_processor.clean_markdown(raw_markdown)
-            chunks = self.text_processor.chunk_text(cleaned_markdown)
-            save_json(chunks, str(output_filepath))
+            chunk_count = save_ndjson(self.text_processor.iter_chunks(cleaned_markdown), output_filepath)
             
-            end_time = datetime.now(timezone.utc)
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.monotonic() - start_time
             
             metadata = self._generate_metadata(
                 source_type=source_type,
                 source_id=source_id,
-                total_chunks=len(chunks),
-                output_chunks_file=str(output_filepath),
+                total_chunks=chunk_count,
+                output_chunks_file=output_filepath,
                 status="success",
-                processing_time=processing_time
+                processing_time=processing_time,
+                timestamp=started_at
             )
             save_metadata(metadata, metadata_path)
-            return {"chunks": chunks, "metadata": metadata}
+            return {"chunks_file": output_filepath, "metadata": metadata}
 
         except Exception as e:
-            end_time = datetime.now(timezone.utc)
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.monotonic() - start_time
             print(f"Error occured when extracting: {e}")
             error_metadata = self._generate_metadata(
                 source_type=source_type,
                 source_id=source_id,
                 total_chunks=0,
-                output_chunks_file=str(output_filepath),
+                output_chunks_file=output_filepath,
                 status="failed",
                 processing_time=processing_time,
+                timestamp=started_at,
                 error_message=str(e)
             )
             save_metadata(error_metadata, metadata_path)
-            return {"chunks": [], "metadata": error_metadata}
+            return {"chunks_file": None, "metadata": error_metadata}
 
     def extract_from_file(self, input_path: str, output_dir: str = "ai_pipeline/data/output/extract", prefix: str = "chunks_") -> Dict[str, Any]:
         return self.extract_from_source(
@@ -122,4 +188,50 @@ class Extractor:
             source_id=input_path,
             output_dir=output_dir,
             prefix=prefix
-        )
\ No newline at end of file
+        )
+
+    def extract_from_file_batch(self, input_paths: List[str], output_dir: str = "ai_pipeline/data/output/extract", prefix: str = "chunks_") -> List[Dict[str, Any]]:
+        # One layout.pipe pass converts every file the fast path could not; cleaning, chunking
+        # and metadata stay per file. If the batch pass fails, fall back to one file at a time.
+        markdowns = []
+        conversion_times = []
+        for path in input_paths:
+            start_time = time.monotonic()
+            markdowns.append(self._extract_text_fast(path) if self.fast_text else "")
+            conversion_times.append(time.monotonic() - start_time)
+        pending = [i for i, markdown in enumerate(markdowns) if not markdown]
+        try:
+            if pending:
+                start_time = time.monotonic()
+                nlp_layout, layout = self._get_layout()
+                for i, doc in zip(pending, layout.pipe([input_paths[i] for i in pending])):
+                    markdowns[i] = doc._.markdown
+                # The batch converts together, so each file is charged an even share
+                share = (time.monotonic() - start_time) / len(pending)
+                for i in pending:
+                    conversion_times[i] += share
+        except Exception as e:
+            print(f"Batch layout pass failed, extracting files one by one: {e}")
+            return [self.extract_from_file(path, output_dir=output_dir, prefix=prefix)["metadata"] for path in input_paths]
+        return [
+            self._extract(lambda markdown=markdown: markdown, "file_system", path, output_dir, prefix, conversion_time)["metadata"]
+            for path, markdown, conversion_time in zip(input_paths, markdowns, conversion_times)
+        ]
+
+    def extract_from_files(self, input_paths: List[str], output_dir: str = "ai_pipeline/data/output/extract", prefix: str = "chunks_", workers: int = None, batch_size: int = 16) -> List[Dict[str, Any]]:
+        workers = workers or os.cpu_count() or 1
+        workers = min(workers, len(input_paths))
+        # Batches no larger than an even split, so every worker gets one
+        batch_size = max(1, min(batch_size, -(-len(input_paths) // max(workers, 1))))
+        batches = [input_paths[i:i + batch_size] for i in range(0, len(input_paths), batch_size)]
+        if workers <= 1:
+            return [metadata for batch in batches for metadata in self.extract_from_file_batch(batch, output_dir=output_dir, prefix=prefix)]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init, initargs=(self.config_source,)) as executor:
+            results = executor.map(
+                _worker_extract_batch,
+                batches,
+                [output_dir] * len(batches),
+                [prefix] * len(batches)
+            )
+            return [metadata for batch_results in results for metadata in batch_results]
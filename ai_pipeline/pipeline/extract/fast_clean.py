@@ -0,0 +1,128 @@
+# ai_pipeline/pipeline/extract/fast_clean.py
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+HAS_FAST_CLEAN = njit is not None
+
+_SPACE = 0x20
+_TAB = 0x09
+_LF = 0x0A
+_CR = 0x0D
+_BACKSLASH = 0x5C
+_LOWER_N = 0x6E
+_DASH = 0x2D
+
+if HAS_FAST_CLEAN:
+    @njit(cache=True)
+    def _translate_collapse_spaces(buf):
+        # Map every codepoint outside tab/LF/CR and printable ASCII to a space
+        # (bullets ·, •, ○ to "- ") while collapsing runs of spaces.
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        n = buf.shape[0]
+        i = 0
+        j = 0
+        while i < n:
+            b = buf[i]
+            if b < 0x80:
+                if b == _TAB or b == _LF or b == _CR or (b >= 0x20 and b <= 0x7E):
+                    c = b
+                else:
+                    c = _SPACE
+                if not (c == _SPACE and j > 0 and out[j - 1] == _SPACE):
+                    out[j] = c
+                    j += 1
+                i += 1
+                continue
+
+            if b >= 0xF0:
+                width = 4
+            elif b >= 0xE0:
+                width = 3
+            else:
+                width = 2
+            bullet = False
+            if width == 2 and i + 1 < n and b == 0xC2 and buf[i + 1] == 0xB7:
+                bullet = True
+            elif width == 3 and i + 2 < n and b == 0xE2:
+                if (buf[i + 1] == 0x80 and buf[i + 2] == 0xA2) or (buf[i + 1] == 0x97 and buf[i + 2] == 0x8B):
+                    bullet = True
+            if bullet:
+                out[j] = _DASH
+                j += 1
+            if not (j > 0 and out[j - 1] == _SPACE):
+                out[j] = _SPACE
+                j += 1
+            i += width
+        return out[:j]
+
+    @njit(cache=True)
+    def _unescape_newlines(buf):
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        n = buf.shape[0]
+        i = 0
+        j = 0
+        while i < n:
+            if buf[i] == _BACKSLASH and i + 1 < n and buf[i + 1] == _LOWER_N:
+                out[j] = _LF
+                i += 2
+            else:
+                out[j] = buf[i]
+                i += 1
+            j += 1
+        return out[:j]
+
+    @njit(cache=True)
+    def _collapse_blank_lines(buf):
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        j = 0
+        run = 0
+        for i in range(buf.shape[0]):
+            if buf[i] == _LF:
+                run += 1
+                if run > 2:
+                    continue
+            else:
+                run = 0
+            out[j] = buf[i]
+            j += 1
+        return out[:j]
+
+    @njit(cache=True)
+    def _strip_trailing_whitespace(buf):
+        out = np.empty(buf.shape[0], dtype=np.uint8)
+        n = buf.shape[0]
+        i = 0
+        j = 0
+        while i < n:
+            b = buf[i]
+            if b == _SPACE or b == _TAB:
+                end = i
+                while end < n and (buf[end] == _SPACE or buf[end] == _TAB):
+                    end += 1
+                if end < n and buf[end] == _LF:
+                    i = end
+                    continue
+                while i < end:
+                    out[j] = buf[i]
+                    j += 1
+                    i += 1
+                continue
+            out[j] = b
+            j += 1
+            i += 1
+        return out[:j]
+
+def clean_markdown_fast(text: str) -> str:
+    # Same transformations as TextProcessor.clean_markdown after image-comment
+    # removal, run as compiled passes over the UTF-8 bytes.
+    buf = np.frombuffer(text.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+    buf = _translate_collapse_spaces(buf)
+    buf = _unescape_newlines(buf)
+    buf = _collapse_blank_lines(buf)
+    buf = _strip_trailing_whitespace(buf)
+    return buf.tobytes().decode("ascii").strip()
@@ -1,15 +1,18 @@
 # ai_pipeline/pipeline/extract/file_utils.py
 
+import os
+from pathlib import Path
 from ai_pipeline.pipeline.parse.file_utils import (
     save_json,
+    save_ndjson,
     get_metadata_filename,
-    save_metadata
+    save_metadata,
+    ensure_dir
 )
 
+def get_metadata_filename_from_stem(stem: str, output_dir: str = "ai_pipeline/data/metadata/extract") -> str:
+    ensure_dir(output_dir)
+    return os.path.join(output_dir, f"metadata_{stem}.json")
+
 def get_metadata_filename(input_path: str, output_dir: str = "ai_pipeline/data/metadata/extract") -> str:
-    from pathlib import Path
-    input_path_obj = Path(input_path)
-    output_dir_path = Path(output_dir)
-    output_dir_path.mkdir(parents=True, exist_ok=True)
-    filename = f"metadata_{input_path_obj.stem}.json"
-    return str(output_dir_path / filename)
\ No newline at end of file
+    return get_metadata_filename_from_stem(Path(input_path).stem, output_dir)
@@ -8,6 +8,8 @@ class LLMProvider(ABC):
         self.config = config or {}
         self.temperature = self.config.get("default_temperature", 0.0)
         self.max_tokens = self.config.get("max_tokens", 4096)
+        # Echo generated text to stdout as it arrives; turned off while calls run concurrently
+        self.echo = True
     
     @abstractmethod
     def call(self, messages: List[Dict[str, str]], config: Dict[str, Any]) -> str:
@@ -1,10 +1,24 @@
 # ai_pipeline/pipeline/llm_providers/cloud_providers.py
 
 import json
+import sys
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List
 from .base import LLMProvider
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_SSE_PREFIX = b"data: "
+# Streamed tokens are echoed as they arrive but stdout is flushed at most this often
+_FLUSH_INTERVAL = 0.05
+
 class CloudProvider(LLMProvider):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -13,6 +27,20 @@ class CloudProvider(LLMProvider):
         self.supports_system_prompt = config.get("supports_system_prompt", True)
         self.supports_json_mode = config.get("supports_system_prompt", True)
         self.stream = config.get("default_stream", True)
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        retries = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"})
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
     
     def call(self, messages: List[Dict[str, str]], config: Dict[str, Any]) -> str:
         full_url = f"{self.url}/chat/stream"
@@ -25,24 +53,31 @@ class CloudProvider(LLMProvider):
         
         if self.stream:
             payload["stream"] = True
-            response_text = ""
-            with requests.post(full_url, json=payload, stream=True, timeout=self.timeout) as response:
+            parts = []
+            last_flush = time.monotonic()
+            with self._session.post(full_url, json=payload, stream=True, timeout=self.timeout) as response:
                 response.raise_for_status()
-                for line in response.iter_lines():
-                    if line:
-                        decoded_line = line.decode('utf-8')
-                        if decoded_line.startswith("data: "):
-                            json_data = json.loads(decoded_line[len("data: "):])
-                            content = json_data.get('content', '')
-                            if content:
-                                response_text += content
-                                print(content, end="", flush=True)
+                for line in response.iter_lines(chunk_size=8192):
+                    if line and line.startswith(_SSE_PREFIX):
+                        json_data = _json_loads(line[len(_SSE_PREFIX):])
+                        content = json_data.get('content', '')
+                        if content:
+                            parts.append(content)
+                            if self.echo:
+                                sys.stdout.write(content)
+                                now = time.monotonic()
+                                if now - last_flush >= _FLUSH_INTERVAL:
+                                    sys.stdout.flush()
+                                    last_flush = now
+            sys.stdout.flush()
+            response_text = "".join(parts)
         else:
             payload["stream"] = False
-            response = requests.post(full_url, json=payload, timeout=self.timeout)
+            response = self._session.post(full_url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             response_json = response.json()
             response_text = response_json.get('choices', [{}])[0].get('message', {}).get('content', '')
-            print(response_text)
+            if self.echo:
+                print(response_text)
         
         return response_text
\ No newline at end of file
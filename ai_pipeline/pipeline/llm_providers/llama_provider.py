@@ -7,13 +7,16 @@ from typing import Dict, Any, List
 from .base import LLMProvider
 
 try:
-    from llama_cpp import Llama
+    from llama_cpp import Llama, LlamaRAMCache
 except ImportError:
     Llama = None
+    LlamaRAMCache = None
 
 class LlamaCppProvider(LLMProvider):
     _llama_instance = None
     _init_lock = threading.Lock()
+    # The shared Llama instance is not thread-safe; concurrent chunk calls take turns
+    _call_lock = threading.Lock()
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -21,6 +24,8 @@ class LlamaCppProvider(LLMProvider):
         self.n_ctx = config.get("n_ctx", 2048)
         self.n_threads = config.get("n_threads", 4)
         self.n_gpu_layers = config.get("n_gpu_layers", 0)
+        self.n_batch = config.get("n_batch", 512)
+        self.cache_capacity_bytes = config.get("cache_capacity_bytes", 2 << 30)
         self.verbose = config.get("verbose", False)
         self.supports_system_prompt = config.get("supports_system_prompt", True)
         self.supports_json_mode = config.get("supports_json_mode", True)
@@ -42,41 +47,46 @@ class LlamaCppProvider(LLMProvider):
                     n_ctx=self.n_ctx,
                     n_threads=self.n_threads,
                     n_gpu_layers=self.n_gpu_layers,
+                    n_batch=self.n_batch,
                     verbose=self.verbose
                 )
+                # Reuse the evaluated KV state for prompts sharing a prefix (e.g. the system prompt)
+                LlamaCppProvider._llama_instance.set_cache(LlamaRAMCache(capacity_bytes=self.cache_capacity_bytes))
                 print("--- Llama model loaded and cached. ---")
         self.llm = LlamaCppProvider._llama_instance
     
     def call(self, messages: List[Dict[str, str]], config: Dict[str, Any]) -> str:
-        prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages])
-        response_text = ""
-        try:
-            print("\n--- Calling local Llama model. This may take some time for complex prompts... ---")
+        with LlamaCppProvider._call_lock:
+            parts = []
+            try:
+                print("\n--- Calling local Llama model. This may take some time for complex prompts... ---")
             
-            response_stream = self.llm(
-                prompt, 
-                max_tokens=self.max_tokens, 
-                temperature=self.temperature, 
-                stop=["</s>", "user:", "assistant:"],
-                stream=self.stream
-            )
+                response_stream = self.llm.create_chat_completion(
+                    messages=messages,
+                    max_tokens=self.max_tokens, 
+                    temperature=self.temperature, 
+                    stream=self.stream
+                )
             
-            if self.stream:
-                print("--- Model is generating response... ---")
-                for chunk in response_stream:
-                    choices = chunk.get('choices', [])
-                    if choices:
-                        content = choices[0].get('text', '')
-                        if content:
-                            print(content, end="", flush=True)
-                            response_text += content
-                print("\n--- Local Llama model finished generating. ---")
-            else:
-                response_text = response_stream["choices"][0]["text"]
-                print(response_text)
+                if self.stream:
+                    print("--- Model is generating response... ---")
+                    for chunk in response_stream:
+                        choices = chunk.get('choices', [])
+                        if choices:
+                            content = choices[0].get('delta', {}).get('content', '')
+                            if content:
+                                if self.echo:
+                                    print(content, end="", flush=True)
+                                parts.append(content)
+                    print("\n--- Local Llama model finished generating. ---")
+                    response_text = "".join(parts)
+                else:
+                    response_text = response_stream["choices"][0]["message"]["content"] or ""
+                    if self.echo:
+                        print(response_text)
             
-        except Exception as e:
-            print(f"\n--- ERROR during Llama call: {e} ---")
-            raise
+            except Exception as e:
+                print(f"\n--- ERROR during Llama call: {e} ---")
+                raise
         
-        return response_text
\ No newline at end of file
+            return response_text
\ No newline at end of file
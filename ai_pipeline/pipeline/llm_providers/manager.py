@@ -57,6 +57,11 @@ class LLMManager:
         print("\nError: All API connection attempts failed.")
         return "", -1
     
+    def set_used_provider(self, index: int):
+        # Lets callers pin the provider after concurrent calls have raced on used_provider_index
+        if 0 <= index < len(self.configs):
+            self.used_provider_index = index
+
     def get_used_provider(self) -> str:
         if self.used_provider_index >= 0 and self.used_provider_index < len(self.configs):
             return self.configs[self.used_provider_index].get("name", "unknown")
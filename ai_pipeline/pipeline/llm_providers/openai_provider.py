@@ -16,12 +16,19 @@ class OpenAIProvider(LLMProvider):
         self.supports_system_prompt = config.get("supports_system_prompt", True)
         self.supports_json_mode = config.get("supports_json_mode", True)
         self.stream = config.get("default_stream", True)
+        self._client = None
+    
+    def _get_client(self) -> "OpenAI":
+        # One client per provider so its HTTP connection pool is reused across calls
+        if self._client is None:
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
     
     def call(self, messages: List[Dict[str, str]], config: Dict[str, Any]) -> str:
         if not OpenAI:
             raise ImportError("OpenAI library is not installed. Please install it with 'pip install openai'.")
         
-        client = OpenAI(api_key=self.api_key)
+        client = self._get_client()
         api_arguments = {
             "model": self.model,
             "messages": messages,
@@ -40,11 +47,12 @@ class OpenAIProvider(LLMProvider):
             api_arguments["stream"] = False
 
         response = client.chat.completions.create(**api_arguments)
-        response_text = ""
+        parts = []
         for chunk in response:
             content = chunk.choices[0].delta.content or ""
             if content:
-                response_text += content
-                print(content, end="", flush=True)
+                parts.append(content)
+                if self.echo:
+                    print(content, end="", flush=True)
         
-        return response_text
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -4,6 +4,12 @@ import json as std_json  # Use alias to avoid potential name collisions
 import os
 from typing import Any, Dict, Union, List
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = std_json.loads
+
 class Config:
     def __init__(
         self,
@@ -43,8 +49,8 @@ class Config:
         
     def _load_config_from_file(self, config_path: str) -> Dict[str, Any]:
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return std_json.load(f)
+            with open(config_path, 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             print(f"Error: Configuration file '{config_path}' not found.")
             return {}
@@ -59,37 +65,51 @@ class Config:
         merged = {
             "version": parse_config.get("version", "1.0.0"),
             "prompt_root": parse_config.get("prompt_root", "ai_pipeline/pipeline/parse/prompts"),
+            "cache_dir": parse_config.get("cache_dir"),
             "pipelines": parse_config.get("pipelines", {}),
             "active": global_providers_config.get("active", {}),
             "providers": global_providers_config.get("providers", {})
         }
         
         if "providers" in merged:
+            env_cache = {}
             for provider_name, provider_config in merged["providers"].items():
-                keys_to_process = list(provider_config.keys())
-                for key in keys_to_process:
-                    if key.endswith("_env"):
-                        env_key = key[:-4]
-                        env_var_name = provider_config[key]
-                        env_value = self._get_env_var(env_var_name)
-                        if env_value is not None:
-                            provider_config[env_key] = env_value
-                        del provider_config[key]
+                env_keys = [key for key in provider_config if key.endswith("_env")]
+                if not env_keys:
+                    continue
+                for key in env_keys:
+                    env_key = key[:-4]
+                    env_var_name = provider_config[key]
+                    if env_var_name not in env_cache:
+                        env_cache[env_var_name] = self._get_env_var(env_var_name)
+                    env_value = env_cache[env_var_name]
+                    if env_value is not None:
+                        provider_config[env_key] = env_value
+                    del provider_config[key]
         return merged
 
     def _deep_merge(self, source_dict: Dict[str, Any], overrides_dict: Dict[str, Any]) -> Dict[str, Any]:
         result = source_dict.copy()
-        for key, value in overrides_dict.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        # Only dicts along the override paths are copied; untouched branches stay shared
+        stack = [(result, overrides_dict)]
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                    target[key] = target[key].copy()
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
         return result
     
     @property
     def prompt_root(self) -> str:
         return self._merged_config.get("prompt_root", "ai_pipeline/pipeline/parse/prompts")
     
+    @property
+    def cache_dir(self) -> Union[str, None]:
+        return self._merged_config.get("cache_dir")
+    
     @property
     def active_provider(self) -> str:
         return self._merged_config.get("active", {}).get("primary", "openai")
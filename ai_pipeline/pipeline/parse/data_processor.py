@@ -1,9 +1,12 @@
 # ai_pipeline/pipeline/parse/data_processor.py
 
+import hashlib
 import json
 import re
-from typing import Any, Dict, List, Union, Set, Tuple
-from collections.abc import Mapping, Sequence
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, FrozenSet, Iterable, List, Union, Set, Tuple
 from pathlib import Path
 
 try:
@@ -12,94 +15,214 @@ except ImportError:
     print("Error: 'json-repair' library not found. Please install it.")
     exit()
 
-from ai_pipeline.pipeline.parse.file_utils import load_text, get_output_filename, save_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ai_pipeline.pipeline.parse.fast_json import HAS_FAST_SLICE, slice_json_fast
+from ai_pipeline.pipeline.parse.file_utils import load_json, load_text, get_output_filename, save_json
+
+_JSON_BLOCK_RE = re.compile(r"\{[\s\S]*\}")
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
+def _loads(text: str) -> Any:
+    # orjson first; stdlib json still accepts what orjson rejects (NaN, out-of-range ints)
+    if orjson:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+def _slice_json(text: str) -> Union[str, None]:
+    # First balanced {...} object, ignoring braces inside string literals. Only the
+    # structural characters are visited, so this is a single forward pass.
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = -1
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return None
 
 class ResumeProcessor: 
-    def __init__(self, schema: Dict[str, Any]):
+    def __init__(self, schema: Dict[str, Any], cache_dir: Union[str, None] = None):
         self.schema = schema
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._schema_string = json.dumps(schema, indent=2)
+        if orjson:
+            self._schema_template_bytes = orjson.dumps(schema)
+        else:
+            self._schema_template_bytes = json.dumps(schema).encode()
+        self._prompts: Dict[str, str] = {}
+
+    def _load_prompt(self, filepath: str) -> str:
+        # Prompt files are read once per processor; missing files are retried next time
+        text = self._prompts.get(filepath)
+        if text is None:
+            text = load_text(filepath)
+            if text:
+                self._prompts[filepath] = text
+        return text
+
+    def _fresh_schema(self) -> Dict[str, Any]:
+        if orjson:
+            return orjson.loads(self._schema_template_bytes)
+        return json.loads(self._schema_template_bytes)
     
     def parse_llm_response(self, response_text: str) -> Dict[str, Any]: 
         if not response_text:
-            return json.loads(json.dumps(self.schema))
+            return self._fresh_schema()
         
         cleaned = response_text.replace("```json", "").replace("```", "").strip()
-        match = re.search(r"\{[\s\S]*\}", cleaned)
+        balanced = slice_json_fast(cleaned) if HAS_FAST_SLICE else _slice_json(cleaned)
+        if balanced is not None:
+            try:
+                return _loads(balanced)
+            except json.JSONDecodeError:
+                pass
+
+        # Unbalanced or malformed: repair the widest first-"{"-to-last-"}" span as before
+        match = _JSON_BLOCK_RE.search(cleaned)
         raw_json = match.group(0) if match else cleaned
 
         try:
-            return json.loads(raw_json)
+            return _loads(raw_json)
         except json.JSONDecodeError:
             try:
                 repaired = repair_json(raw_json)
-                return json.loads(repaired)
+                return _loads(repaired)
             except Exception:
                 print("Failed to repair JSON. Returning default schema.")
-                return json.loads(json.dumps(self.schema))
+                return self._fresh_schema()
     
     def normalize_json_preserve_structure(self, data: Any, remove_empty: bool = True, remove_duplicates: bool = True, case_sensitive_duplicates: bool = True, preserve_order: bool = True, deep_copy: bool = True) -> Any:
-        if deep_copy:
-            data = json.loads(json.dumps(data))
-        
-        if isinstance(data, Mapping):
-            return self._normalize_dict_preserve(data, remove_empty, remove_duplicates, case_sensitive_duplicates, preserve_order)
-        elif isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
-            return self._normalize_list_preserve(data, remove_empty, remove_duplicates, case_sensitive_duplicates, preserve_order)
-        else:
-            return self._normalize_primitive(data, remove_empty)
-    
-    def _normalize_dict_preserve(self, data: Dict[str, Any], remove_empty: bool, remove_duplicates: bool, case_sensitive_duplicates: bool, preserve_order: bool) -> Dict[str, Any]:
-        result = {}
-        for key, value in data.items():
-            normalized_value = self.normalize_json_preserve_structure(value, remove_empty, remove_duplicates, case_sensitive_duplicates, preserve_order, deep_copy=False)
-            result[key] = normalized_value
-        if remove_empty and self._is_completely_empty(result):
-            return {}
-        return result
+        # The walk below always builds new containers, so deep_copy needs no up-front copy
+        if not isinstance(data, (dict, list)):
+            return data.strip() if isinstance(data, str) else data
+
+        # Pre-order collect the containers, then rebuild them children-first so no
+        # Python frame is pushed per node
+        order = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            children = node.values() if isinstance(node, dict) else node
+            stack.extend(child for child in children if isinstance(child, (dict, list)))
+
+        # Emptiness of each rebuilt container is derived from its children as it is
+        # built, so no subtree is rescanned by _is_completely_empty
+        built: Dict[int, Any] = {}
+        empty: Dict[int, bool] = {}
+        memo: Dict[int, Any] = {}
+        for node in reversed(order):
+            all_empty = True
+            if isinstance(node, dict):
+                result = {}
+                for key, value in node.items():
+                    if isinstance(value, str):
+                        value = value.strip()
+                        value_empty = not value
+                    elif isinstance(value, (dict, list)):
+                        value_empty = empty[id(value)]
+                        value = built[id(value)]
+                    else:
+                        value_empty = value is None
+                    all_empty = all_empty and value_empty
+                    result[key] = value
+                if remove_empty and all_empty:
+                    result = {}
+            else:
+                result = []
+                seen = set()
+                for item in node:
+                    if isinstance(item, str):
+                        item = item.strip()
+                        item_empty = not item
+                    elif isinstance(item, (dict, list)):
+                        item_empty = empty[id(item)]
+                        item = built[id(item)]
+                    else:
+                        item_empty = item is None
+                    if remove_empty and item_empty:
+                        continue
+                    if remove_duplicates:
+                        item_key = self._make_hashable(item, case_sensitive_duplicates, memo)
+                        if item_key in seen:
+                            continue
+                        seen.add(item_key)
+                    result.append(item)
+                    all_empty = all_empty and item_empty
+            built[id(node)] = result
+            empty[id(node)] = all_empty
+        return built[id(data)]
     
-    def _normalize_list_preserve(self, data: List[Any], remove_empty: bool, remove_duplicates: bool, case_sensitive_duplicates: bool, preserve_order: bool) -> List[Any]:
-        result = []
-        seen = set()
-        for item in data:
-            normalized_item = self.normalize_json_preserve_structure(item, remove_empty, remove_duplicates, case_sensitive_duplicates, preserve_order, deep_copy=False)
-            if remove_empty and self._is_completely_empty(normalized_item):
+    def _is_completely_empty(self, value: Any) -> bool:
+        stack = [value]
+        while stack:
+            current = stack.pop()
+            if current is None:
                 continue
-            if remove_duplicates:
-                item_key = self._make_hashable(normalized_item, case_sensitive_duplicates)
-                if item_key in seen:
-                    continue
-                seen.add(item_key)
-            result.append(normalized_item)
-        return result
-    
-    def _normalize_primitive(self, data: Any, remove_empty: bool) -> Any:
-        if isinstance(data, str):
-            return data.strip()
-        return data
+            if isinstance(current, str):
+                if current.strip():
+                    return False
+            elif isinstance(current, dict):
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+            else:
+                return False
+        return True
     
-    def _is_completely_empty(self, value: Any) -> bool:
-        if value is None:
-            return True
-        if isinstance(value, str) and not value.strip():
-            return True
-        if isinstance(value, (list, dict)) and not value:
-            return True
+    def _make_hashable(self, value: Any, case_sensitive: bool = True, memo: Dict[int, Any] = None) -> Union[Tuple, FrozenSet, str, int, float, bool, None]:
         if isinstance(value, dict):
-            return all(self._is_completely_empty(v) for v in value.values())
-        if isinstance(value, list):
-            return all(self._is_completely_empty(item) for item in value)
-        return False
-    
-    def _make_hashable(self, value: Any, case_sensitive: bool = True) -> Union[Tuple, str, int, float, bool, None]:
-        if isinstance(value, Mapping):
-            return tuple(sorted((k, self._make_hashable(v, case_sensitive)) for k, v in value.items()))
-        elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
-            return tuple(self._make_hashable(item, case_sensitive) for item in value)
+            if memo is not None and id(value) in memo:
+                return memo[id(value)][1]
+            key = frozenset((k, self._make_hashable(v, case_sensitive, memo)) for k, v in value.items())
+        elif isinstance(value, list):
+            if memo is not None and id(value) in memo:
+                return memo[id(value)][1]
+            key = tuple(self._make_hashable(item, case_sensitive, memo) for item in value)
         elif isinstance(value, str):
             return value if case_sensitive else value.lower()
-        return value
+        else:
+            return value
+        if memo is not None:
+            # Keep a reference to the container so its id cannot be reused during the pass
+            memo[id(value)] = (value, key)
+        return key
+    
+    def _dedupe_case_insensitive(self, items: Iterable[Any]) -> List[str]:
+        # Strips, drops blanks and keeps the first-seen casing of each skill in one pass
+        seen = {}
+        for item in items:
+            skill = str(item).strip()
+            if skill:
+                seen.setdefault(skill.lower(), skill)
+        return list(seen.values())
     
     def local_structural_cleaning(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
-        normalized = self.normalize_json_preserve_structure(resume_data)
+        normalized = self.normalize_json_preserve_structure(resume_data, deep_copy=False)
         for key in ["education", "work_experience", "certifications", "projects"]:
             if key in normalized and isinstance(normalized[key], dict) and "items" in normalized[key]:
                 non_empty_items = [
@@ -109,37 +232,40 @@ class ResumeProcessor:
                 normalized[key]["items"] = non_empty_items
         
         if 'skills' in normalized and isinstance(normalized['skills'], dict) and 'items' in normalized['skills']:
-            skills = [skill.strip() for skill in normalized['skills']['items'] if isinstance(skill, str) and skill.strip()]
-            unique_skills = []
-            seen_skills = set()
-            for skill in skills:
-                if skill.lower() not in seen_skills:
-                    seen_skills.add(skill.lower())
-                    unique_skills.append(skill)
-            normalized['skills']['items'] = unique_skills
+            skills = normalized['skills']['items']
+            normalized['skills']['items'] = self._dedupe_case_insensitive(skill for skill in skills if isinstance(skill, str))
             
         return normalized
     
     def merge_results(self, base: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
-        if new.get("summary", {}).get("confidence", 0) > base.get("summary", {}).get("confidence", 0):
-            base["summary"] = new.get("summary", base["summary"])
-            
-        for key in ["education", "work_experience", "certifications", "projects"]:
-            if key in new and "items" in new[key] and isinstance(new[key]["items"], list):
-                if new[key]["items"]:
-                    base[key]["items"].extend(new[key]["items"])
-                    if new[key].get("confidence", 0) > base[key].get("confidence", 0):
-                        base[key]["confidence"] = new[key]["confidence"]
+        return self.merge_all_results(base, [new])
+    
+    def merge_all_results(self, base: Dict[str, Any], partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        # Item lists are gathered per key and concatenated once at the end
+        item_parts = defaultdict(list)
+        for new in partials:
+            if new.get("summary", {}).get("confidence", 0) > base.get("summary", {}).get("confidence", 0):
+                base["summary"] = new.get("summary", base["summary"])
+                
+            for key in ["education", "work_experience", "certifications", "projects"]:
+                if key in new and "items" in new[key] and isinstance(new[key]["items"], list):
+                    if new[key]["items"]:
+                        item_parts[key].append(new[key]["items"])
+                        if new[key].get("confidence", 0) > base[key].get("confidence", 0):
+                            base[key]["confidence"] = new[key]["confidence"]
+
+            if "skills" in new and "items" in new["skills"] and isinstance(new["skills"]["items"], list):
+                item_parts["skills"].append(new["skills"]["items"])
+                if new["skills"].get("confidence", 0) > base["skills"].get("confidence", 0):
+                    base["skills"]["confidence"] = new["skills"]["confidence"]
 
-        if "skills" in new and "items" in new["skills"] and isinstance(new["skills"]["items"], list):
-            base["skills"]["items"].extend(new["skills"]["items"])
-            if new["skills"].get("confidence", 0) > base["skills"].get("confidence", 0):
-                base["skills"]["confidence"] = new["skills"]["confidence"]
+        for key, parts in item_parts.items():
+            base[key]["items"] = list(chain(base[key]["items"], chain.from_iterable(parts)))
         return base
     
     def final_validation_and_cleaning(self, data: Dict[str, Any]) -> Dict[str, Any]:
         print("\n--- Starting Final Validation and Structural Cleaning ---")
-        final_data = json.loads(json.dumps(self.schema))
+        final_data = self._fresh_schema()
 
         def validate_confidence(conf_val: Any) -> float:
             try:
@@ -159,18 +285,53 @@ class ResumeProcessor:
 
         if "skills" in data and isinstance(data["skills"], dict):
             if isinstance(data["skills"].get("items"), list):
-                skills_list = [str(skill).strip() for skill in data["skills"]["items"] if str(skill).strip()]
-                unique_skills = []
-                seen_skills = set()
-                for skill in skills_list:
-                    if skill.lower() not in seen_skills:
-                        seen_skills.add(skill.lower())
-                        unique_skills.append(skill)
-                final_data["skills"]["items"] = unique_skills
+                final_data["skills"]["items"] = self._dedupe_case_insensitive(data["skills"]["items"])
             final_data["skills"]["confidence"] = validate_confidence(data["skills"].get("confidence"))
             
         return final_data
     
+    def _dumps_indented(self, data: Any) -> str:
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return json.dumps(data, indent=2)
+
+    def _step_cache_path(self, llm_manager, step_name: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> Union[Path, None]:
+        if not self.cache_dir:
+            return None
+        hasher = hashlib.blake2b(digest_size=16)
+        # The provider chain decides who answers, so a different provider or model misses
+        for config in llm_manager.configs:
+            for key in ("type", "name", "model", "model_path", "url"):
+                hasher.update(str(config.get(key, "")).encode("utf-8"))
+                hasher.update(b"\0")
+        for message in messages:
+            hasher.update(message["content"].encode("utf-8"))
+            hasher.update(b"\0")
+        hasher.update(f"{temperature}\0{max_tokens}".encode())
+        return self.cache_dir / step_name / f"{hasher.hexdigest()}.json"
+
+    def _get_step_result(self, llm_manager, step_name: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> Tuple[Union[Dict[str, Any], None], int]:
+        # Returns the parsed result and the index of the provider that answered (-1 if unknown)
+        cache_path = self._step_cache_path(llm_manager, step_name, messages, temperature, max_tokens)
+        if cache_path and cache_path.exists():
+            cached = load_json(str(cache_path))
+            if cached.get("result"):
+                print(f"--- Using cached response for step '{step_name}' ({cache_path.name}) ---")
+                names = [config.get("name", "unknown") for config in llm_manager.configs]
+                provider = cached.get("provider")
+                return cached["result"], names.index(provider) if provider in names else -1
+        
+        response_text, provider_index = llm_manager.get_response(messages)
+        if not response_text:
+            return None, -1
+        
+        result = self.parse_llm_response(response_text)
+        # Unparseable responses fall back to the empty schema; don't pin those in the cache
+        if cache_path and result != self._fresh_schema():
+            # The answering provider is stored so a cache hit picks the same follow-up pipeline
+            save_json({"provider": llm_manager.configs[provider_index].get("name", "unknown"), "result": result}, str(cache_path))
+        return result, provider_index
+
     def run_pipeline_step(self, llm_manager, step_config: Dict[str, Any], input_data: Any, prompt_root: str) -> Dict[str, Any]:
         step_name = step_config.get("name", "unknown")
         system_prompt_path = step_config.get("system_prompt", "")
@@ -179,14 +340,25 @@ class ResumeProcessor:
         max_tokens = step_config.get("max_tokens", 4096)
         print(f"\n--- Running Step: {step_name} ---")
         
-        system_prompt = load_text(f"{prompt_root}/{system_prompt_path}")
-        prompt_template = load_text(f"{prompt_root}/{prompt_path}")
-        schema_string = json.dumps(self.schema, indent=2)
+        system_prompt = self._load_prompt(f"{prompt_root}/{system_prompt_path}")
+        prompt_template = self._load_prompt(f"{prompt_root}/{prompt_path}")
+        schema_string = self._schema_string
+        
+        concurrency = max(1, int(step_config.get("concurrency", 1)))
+        run_concurrently = step_name == "parse" and concurrency > 1 and len(input_data) > 1
+        
+        # Override temperature and max_tokens once for the whole step; concurrent
+        # calls would interleave their streamed output, so echo only when sequential
+        for provider in llm_manager.providers:
+            provider.temperature = temperature
+            provider.max_tokens = max_tokens
+            provider.echo = not run_concurrently
         
         if step_name == "parse":
             chunks = input_data
-            merged_result = json.loads(json.dumps(self.schema))
-            for i, chunk in enumerate(chunks):
+            merged_result = self._fresh_schema()
+            
+            def process_chunk(i: int, chunk: str) -> Tuple[Union[Dict[str, Any], None], int]:
                 print(f"\n--- Processing Chunk {i+1}/{len(chunks)} ---")
                 user_prompt = prompt_template.format(schema=schema_string, chunk=chunk)
                 messages = [
@@ -194,23 +366,32 @@ class ResumeProcessor:
                     {"role": "user", "content": user_prompt},
                 ]
                 
-                # Override temperature and max_tokens for this step
-                for provider in llm_manager.providers:
-                    provider.temperature = temperature
-                    provider.max_tokens = max_tokens
-                
-                response_text, _ = llm_manager.get_response(messages)
+                partial_result, provider_index = self._get_step_result(llm_manager, step_name, messages, temperature, max_tokens)
                 
-                if not response_text:
+                if partial_result is None:
                     print(f"Skipping chunk {i+1} due to API failure.")
-                    continue
-                
-                partial_result = self.parse_llm_response(response_text)
-                merged_result = self.merge_results(merged_result, partial_result)
+                return partial_result, provider_index
+            
+            if run_concurrently:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+                    futures = [executor.submit(process_chunk, i, chunk) for i, chunk in enumerate(chunks)]
+                    chunk_results = [future.result() for future in futures]
+            else:
+                chunk_results = [process_chunk(i, chunk) for i, chunk in enumerate(chunks)]
+            
+            # Merge in chunk order so the result does not depend on completion order
+            partial_results = [partial_result for partial_result, _ in chunk_results if partial_result is not None]
+            merged_result = self.merge_all_results(merged_result, partial_results)
+            
+            # Worker threads race on the manager's used provider; pin it to the last
+            # answered chunk in chunk order, as a sequential run would leave it
+            answered = [provider_index for _, provider_index in chunk_results if provider_index >= 0]
+            if answered:
+                llm_manager.set_used_provider(answered[-1])
             
             return merged_result
         else:
-            input_json_string = json.dumps(input_data, indent=2)
+            input_json_string = self._dumps_indented(input_data)
             user_prompt = prompt_template.format(schema=schema_string, input_json=input_json_string)
             
             messages = [
@@ -218,18 +399,14 @@ class ResumeProcessor:
                 {"role": "user", "content": user_prompt},
             ]
             
-            # Override temperature and max_tokens for this step
-            for provider in llm_manager.providers:
-                provider.temperature = temperature
-                provider.max_tokens = max_tokens
-            
-            response_text, _ = llm_manager.get_response(messages)
+            result, provider_index = self._get_step_result(llm_manager, step_name, messages, temperature, max_tokens)
+            llm_manager.set_used_provider(provider_index)
             
-            if not response_text:
+            if result is None:
                 print("Validation step failed due to API issues. Returning input data.")
                 return input_data
             
-            return self.parse_llm_response(response_text)
+            return result
 
 
     def process_resume(self, llm_manager, chunks: List[str], config) -> Dict[str, Any]:
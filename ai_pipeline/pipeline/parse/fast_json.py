@@ -0,0 +1,59 @@
+# ai_pipeline/pipeline/parse/fast_json.py
+
+from typing import Union
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+HAS_FAST_SLICE = njit is not None
+
+_QUOTE = 0x22
+_BACKSLASH = 0x5C
+_OPEN_BRACE = 0x7B
+_CLOSE_BRACE = 0x7D
+
+if HAS_FAST_SLICE:
+    @njit(cache=True)
+    def _find_json_span(buf):
+        # Byte offsets of the first balanced {...} object, skipping braces inside
+        # string literals; (-1, -1) when there is none.
+        n = buf.shape[0]
+        i = 0
+        while i < n and buf[i] != _OPEN_BRACE:
+            i += 1
+        start = i
+        depth = 0
+        in_string = False
+        escaped = False
+        while i < n:
+            b = buf[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif b == _BACKSLASH:
+                    escaped = True
+                elif b == _QUOTE:
+                    in_string = False
+            elif b == _QUOTE:
+                in_string = True
+            elif b == _OPEN_BRACE:
+                depth += 1
+            elif b == _CLOSE_BRACE:
+                depth -= 1
+                if depth == 0:
+                    return start, i + 1
+            i += 1
+        return -1, -1
+
+def slice_json_fast(text: str) -> Union[str, None]:
+    # Same result as data_processor._slice_json, scanned as compiled code over the
+    # UTF-8 bytes. The span ends on ASCII braces, so the byte slice decodes cleanly.
+    data = text.encode("utf-8", "surrogatepass")
+    start, end = _find_json_span(np.frombuffer(data, dtype=np.uint8))
+    if start == -1:
+        return None
+    return data[start:end].decode("utf-8", "surrogatepass")
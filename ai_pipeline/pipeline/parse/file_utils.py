@@ -3,12 +3,28 @@
 import os
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Union
+
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Directories already created in this process, so repeated saves skip the mkdir syscalls
+_MKDIR_CACHE = set()
+
+def ensure_dir(directory: Union[str, Path]):
+    key = str(directory)
+    if key not in _MKDIR_CACHE:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(key)
 
 def load_json(filepath: str) -> Dict[str, Any]:
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _json_loads(Path(filepath).read_bytes())
     except FileNotFoundError:
         print(f"Error: File not found at '{filepath}'")
         return {}
@@ -16,11 +32,45 @@ def load_json(filepath: str) -> Dict[str, Any]:
         print(f"Error: Could not decode JSON from '{filepath}'")
         return {}
 
-def save_json(data: Any, filepath: str):
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+def _write_json(data: Any, filepath: str):
+    ensure_dir(Path(filepath).parent)
+    if orjson:
+        Path(filepath).write_bytes(orjson.dumps(data, option=_ORJSON_OPTIONS))
+        return
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+
+def save_json(data: Any, filepath: str):
+    _write_json(data, filepath)
+    print(f"\n--- Result saved to '{filepath}' ---")
+
+def load_ndjson(filepath: str) -> List[Any]:
+    try:
+        with open(filepath, 'rb') as f:
+            return [_json_loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        print(f"Error: File not found at '{filepath}'")
+        return []
+    except json.JSONDecodeError:
+        print(f"Error: Could not decode JSON lines from '{filepath}'")
+        return []
+
+def save_ndjson(items: Iterable[Any], filepath: str) -> int:
+    ensure_dir(Path(filepath).parent)
+    count = 0
+    if orjson:
+        with open(filepath, 'wb') as f:
+            for item in items:
+                f.write(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False))
+                f.write("\n")
+                count += 1
     print(f"\n--- Result saved to '{filepath}' ---")
+    return count
 
 def load_text(filepath: str) -> str:
     try:
@@ -33,20 +83,18 @@ def load_text(filepath: str) -> str:
 def get_output_filename(input_path: str, output_dir: str = "ai_pipeline/data/output/parse", prefix: str = "", suffix: str = "_parsed") -> str:
     input_path = Path(input_path)
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
     
     filename = f"{prefix}{input_path.stem}{suffix}.json"
     return str(output_dir / filename)
 
 def save_metadata(data: Dict[str, Any], filepath: str):
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(data, filepath)
     print(f"\n--- Metadata saved to '{filepath}' ---")
 
 def get_metadata_filename(input_path: str, output_dir: str = "ai_pipeline/data/metadata/parse") -> str:
     input_path = Path(input_path)
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
     filename = f"metadata_{input_path.stem}.json"
     return str(output_dir / filename)
\ No newline at end of file
@@ -12,7 +12,7 @@ else:
     load_dotenv()
 
 from .parser import parse_resume_data
-from .file_utils import load_json, save_json, get_output_filename, save_metadata, get_metadata_filename
+from .file_utils import load_json, load_ndjson, save_json, get_output_filename, save_metadata, get_metadata_filename
 
 def main():
     parser = argparse.ArgumentParser(description='Parse resume from chunks.')
@@ -20,7 +20,7 @@ def main():
         '--input', '-i', 
         type=str, 
         required=True, 
-        help='Path to the chunks JSON file.'
+        help='Path to the chunks JSON or JSON Lines file.'
     )
     parser.add_argument(
         '--output', '-o', 
@@ -44,7 +44,10 @@ def main():
     args = parser.parse_args()
     
     try:
-        chunks = load_json(args.input)
+        if args.input.endswith(".jsonl"):
+            chunks = load_ndjson(args.input)
+        else:
+            chunks = load_json(args.input)
         if not chunks:
             print("Exiting due to missing or empty input chunks.")
             return
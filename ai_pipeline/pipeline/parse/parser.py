@@ -1,12 +1,26 @@
 # ai_pipeline/pipeline/parse/parser.py
 
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Tuple, Union
 from .config import Config
 from .data_processor import ResumeProcessor
 from ..llm_providers.manager import LLMManager
 from .file_utils import load_json, save_json, save_metadata, get_metadata_filename, get_output_filename
 import datetime
 
+# A processor only holds its schema, cache dir and prompt texts, so one per
+# (schema, cache dir) serves every resume instead of reloading them per call
+_PROCESSORS: Dict[Tuple[str, Any], ResumeProcessor] = {}
+
+def _get_processor(schema_path: str, cache_dir: Any) -> ResumeProcessor:
+    key = (schema_path, cache_dir)
+    processor = _PROCESSORS.get(key)
+    if processor is None:
+        schema = load_json(schema_path)
+        if not schema:
+            raise ValueError("Schema could not be loaded. Exiting.")
+        processor = _PROCESSORS.setdefault(key, ResumeProcessor(schema, cache_dir=cache_dir))
+    return processor
+
 def _sanitize_provider_config_for_metadata(provider_config: Dict[str, Any]) -> Dict[str, Any]:
     SENSITIVE_KEYS = {
         "api_key", "url", "model_path", "api_base" 
@@ -93,17 +107,13 @@ def parse_resume_data(
             config = Config(parse_config=config_path, global_providers=global_providers_path)
         
         schema_path = "ai_pipeline/pipeline/parse/schema.json"
-        schema = load_json(schema_path)
-        if not schema:
-            raise ValueError("Schema could not be loaded. Exiting.")
+        processor = _get_processor(schema_path, config.cache_dir)
 
         providers_config = config.get_all_providers_config()
         llm_manager = LLMManager(providers_config)
         
         if not llm_manager.providers:
             raise ValueError("Could not initialize any LLM provider.")
-            
-        processor = ResumeProcessor(schema)
 
         final_result = processor.process_resume(
             llm_manager=llm_manager, 
@@ -1,7 +1,19 @@
 # ai_pipeline/pipeline/skill_match/config.py
 
 import json
-from typing import Any, Dict, Union
+import os
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Parsed config files keyed by (path, mtime), so repeated Config construction skips disk and parse
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
 
 class Config:
     def __init__(self, config_source: Union[str, Dict[str, Any]]):
@@ -17,41 +29,46 @@ class Config:
         
     def _load_config_from_file(self, config_path: str) -> Dict[str, Any]:
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            cache_key = (os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            config_data = _json_loads(Path(config_path).read_bytes())
+            _CONFIG_CACHE[cache_key] = config_data
+            return config_data
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading config from '{config_path}': {e}")
             return {}
     
-    @property
+    @cached_property
     def version(self) -> str:
         return self._config_data.get("version", "1.0.0")
     
-    @property
+    @cached_property
     def model_settings(self) -> Dict[str, Any]:
         return self._config_data.get("model_settings", {})
     
-    @property
+    @cached_property
     def scoring_weights(self) -> Dict[str, Any]:
         return self._config_data.get("scoring_weights", {})
     
-    @property
+    @cached_property
     def skill_thresholds(self) -> Dict[str, Any]:
         return self._config_data.get("skill_thresholds", {})
     
-    @property
+    @cached_property
     def similarity_weights(self) -> Dict[str, Any]:
         return self._config_data.get("similarity_weights", {})
         
-    @property
+    @cached_property
     def normalization(self) -> Dict[str, Any]:
         return self._config_data.get("normalization", {})
     
-    @property
+    @cached_property
     def synonym_file(self) -> str:
         return self._config_data.get("synonym_file", "")
         
-    @property
+    @cached_property
     def acronym_file(self) -> str:
         return self._config_data.get("acronym_file", "")
     
@@ -2,27 +2,55 @@
 
 import re
 import string
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# Caches are cleared wholesale when they reach this size to bound memory in long-lived matchers
+_MAX_CACHE_ENTRIES = 65536
 
 class TextNormalizer:
     def __init__(self, normalization_config: Dict[str, Any], synonym_map: Dict[str, Any], acronym_map: Dict[str, Any]):
         self.config = normalization_config
         self.synonym_map = synonym_map
         self.acronym_map = acronym_map
+        self._synonym_index = {}
+        for canonical_term, synonyms in synonym_map.items():
+            # setdefault keeps the first canonical term that claims a surface form
+            self._synonym_index.setdefault(canonical_term.lower(), canonical_term.lower())
+            for synonym in synonyms:
+                self._synonym_index.setdefault(synonym.lower(), canonical_term.lower())
+        self._acronym_lookup = {k.lower(): v for k, v in acronym_map.items()}
+        self._acronym_re = None
+        if acronym_map:
+            # Longest first so e.g. "ci/cd" wins over any shorter acronym at the same position
+            alternation = "|".join(re.escape(k) for k in sorted(acronym_map, key=len, reverse=True))
+            self._acronym_re = re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+        self._punct_table = str.maketrans('', '', string.punctuation)
+        self._norm_cache: Dict[str, str] = {}
 
     def normalize(self, text: str) -> str:
         if not text:
             return ""
+        cached = self._norm_cache.get(text)
+        if cached is not None:
+            return cached
+        if len(self._norm_cache) >= _MAX_CACHE_ENTRIES:
+            self._norm_cache.clear()
+        normalized = self._normalize_uncached(text)
+        self._norm_cache[text] = normalized
+        return normalized
+
+    def _normalize_uncached(self, text: str) -> str:
         original_text = text
-        if self.config.get("apply_acronyms", False):
-            for lower_acronym, upper_acronym in self.acronym_map.items():
-                text = re.sub(r'\b' + re.escape(lower_acronym) + r'\b', upper_acronym, text, flags=re.IGNORECASE)
+        if self.config.get("apply_acronyms", False) and self._acronym_re:
+            text = self._acronym_re.sub(lambda m: self._acronym_lookup[m.group(0).lower()], text)
 
         if self.config.get("apply_synonyms", False):
-            normalized_input = text.lower()
-            for canonical_term, synonyms in self.synonym_map.items():
-                if normalized_input == canonical_term.lower() or normalized_input in [s.lower() for s in synonyms]:
-                    return canonical_term.lower()
+            canonical_term = self._synonym_index.get(text.lower())
+            if canonical_term is not None:
+                return canonical_term
 
         if self.config.get("lowercase", False):
             text = text.lower()
@@ -31,13 +59,17 @@ class TextNormalizer:
             text = text.strip()
 
         if self.config.get("remove_punctuation", False):
-            text = text.translate(str.maketrans('', '', string.punctuation))
+            text = text.translate(self._punct_table)
             
         return text
 
     def lexical_similarity(self, text1: str, text2: str) -> float:
-        from rapidfuzz import fuzz 
-        
         norm1 = self.normalize(text1)
         norm2 = self.normalize(text2)
-        return fuzz.token_set_ratio(norm1, norm2) / 100.0
\ No newline at end of file
+        return fuzz.token_set_ratio(norm1, norm2) / 100.0
+
+    def lexical_similarity_matrix(self, texts_a: List[str], texts_b: List[str]) -> np.ndarray:
+        normalized_a = [self.normalize(text) for text in texts_a]
+        normalized_b = [self.normalize(text) for text in texts_b]
+        scores = process.cdist(normalized_a, normalized_b, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=-1)
+        return scores / 100.0
\ No newline at end of file
@@ -0,0 +1,103 @@
+# ai_pipeline/pipeline/skill_match/embedding_cache.py
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+_INITIAL_CAPACITY = 1024
+
+class EmbeddingCache:
+    # Embeddings live in a preallocated float32 .npy matrix opened as a memmap; a JSON
+    # sidecar lists the cached texts in row order, so rows past len(index) are free capacity.
+    def __init__(self, cache_dir: Path, name: str):
+        self.matrix_file = Path(cache_dir) / f"{name}.npy"
+        self.index_file = Path(cache_dir) / f"{name}.index.json"
+        self._key_to_row: Dict[str, int] = {}
+        self._matrix = None
+        self._load()
+
+    def _load(self):
+        if not (self.matrix_file.exists() and self.index_file.exists()):
+            return
+        try:
+            keys = _json_loads(self.index_file.read_bytes())
+            matrix = np.load(self.matrix_file, mmap_mode='r+')
+            if matrix.ndim != 2 or len(keys) > matrix.shape[0]:
+                raise ValueError("index does not match the embedding matrix")
+        except Exception as e:
+            logging.warning(f"Could not load embedding cache. Starting fresh. Error: {e}")
+            return
+        self._matrix = matrix
+        self._key_to_row = {key: row for row, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self._key_to_row)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_to_row
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self._matrix[self._key_to_row[key]]
+
+    def rows(self, keys: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self._key_to_row[key] for key in keys), dtype=np.intp)
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        return self._matrix[rows]
+
+    def _ensure_capacity(self, rows_needed: int, dim: int):
+        if self._matrix is not None and rows_needed <= self._matrix.shape[0]:
+            return
+        capacity = max(_INITIAL_CAPACITY, rows_needed)
+        if self._matrix is not None:
+            capacity = max(capacity, self._matrix.shape[0] * 2)
+        self.matrix_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.matrix_file.with_name(self.matrix_file.name + ".tmp")
+        grown = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=np.float32, shape=(capacity, dim))
+        if self._matrix is not None and len(self):
+            grown[:len(self)] = self._matrix[:len(self)]
+        grown.flush()
+        del grown
+        # Windows refuses to replace a file that is still memory-mapped
+        self._matrix = None
+        os.replace(tmp_file, self.matrix_file)
+        self._matrix = np.load(self.matrix_file, mmap_mode='r+')
+
+    def add(self, keys: Iterable[str], vectors: np.ndarray):
+        keys = list(keys)
+        if not keys:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        start = len(self)
+        self._ensure_capacity(start + len(keys), vectors.shape[1])
+        self._matrix[start:start + len(keys)] = vectors
+        for offset, key in enumerate(keys):
+            self._key_to_row[key] = start + offset
+
+    def keys(self) -> List[str]:
+        return list(self._key_to_row)
+
+    def flush(self):
+        if self._matrix is None:
+            return
+        # Rows first, then the index, so the index never points past written data
+        self._matrix.flush()
+        keys = self.keys()
+        # Swapped in whole, so a crash mid-write cannot leave a truncated index behind
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        if orjson:
+            tmp_file.write_bytes(orjson.dumps(keys))
+        else:
+            tmp_file.write_text(json.dumps(keys, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_file, self.index_file)
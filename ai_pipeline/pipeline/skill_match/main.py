@@ -6,12 +6,17 @@ from pathlib import Path
 from typing import List, Dict, Any
 
 from .skill_matcher import SkillMatcher
-from ai_pipeline.pipeline.parse.file_utils import save_json, save_metadata
+from ai_pipeline.pipeline.parse.file_utils import save_json, save_metadata, ensure_dir
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 def load_json(filepath: str) -> Any:
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _json_loads(Path(filepath).read_bytes())
     except FileNotFoundError:
         print(f"Error: Input file not found at '{filepath}'")
         raise
@@ -22,7 +27,7 @@ def load_json(filepath: str) -> Any:
 def get_output_filename(input_path: str, output_dir: str = "ai_pipeline/data/output/skill_match", suffix: str = "_matching_results") -> str:
     input_path_obj = Path(input_path)
     output_dir_path = Path(output_dir)
-    output_dir_path.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir_path)
     filename = f"{input_path_obj.stem}{suffix}.json"
     return str(output_dir_path / filename)
 
@@ -30,7 +35,7 @@ def get_metadata_filename(candidate_path: str, job_path: str, output_dir: str =
     candidate_name = Path(candidate_path).stem
     job_name = Path(job_path).stem
     output_dir_path = Path(output_dir)
-    output_dir_path.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir_path)
     filename = f"metadata_{candidate_name}_vs_{job_name}.json"
     return str(output_dir_path / filename)
 
@@ -87,6 +92,7 @@ def main():
             job_source_type="file_system",
             job_id=args.job_description
         )
+        matcher.close()
         
         results = matching_output.get("results", {})
         metadata = matching_output.get("metadata", {})
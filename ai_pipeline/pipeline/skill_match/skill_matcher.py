@@ -5,19 +5,35 @@ import numpy as np
 import joblib
 from pathlib import Path
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Union
 import time
 from datetime import datetime, timezone
-from sentence_transformers import SentenceTransformer, util
+from itertools import compress
+from sentence_transformers import SentenceTransformer
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 from .config import Config
 from .data_processor import TextNormalizer
+from .embedding_cache import EmbeddingCache
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# New embeddings are flushed to disk in the background this long after the first unsaved insert
+_CACHE_SAVE_DELAY_SECONDS = 5.0
+
 class SkillMatcher:
     def __init__(self, config_source: Union[str, Dict[str, Any]] = "ai_pipeline/pipeline/skill_match/config.json"):
-        self.embedding_cache = {}
+        self.embedding_cache = None
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        self._save_timer = None
         self.config = Config(config_source)
         logging.info(f"Loaded skill match configuration version {self.config.version}")
 
@@ -27,12 +43,18 @@ class SkillMatcher:
         self.normalizer = TextNormalizer(self.config.normalization, self.synonym_map, self.acronym_map)
 
         logging.info("Loading sentence transformer model... (this may take a moment)")
-        self.model = SentenceTransformer(self.config.model_settings["model_name"])
+        # No "device" setting lets sentence-transformers pick CUDA when it is available
+        self.model = SentenceTransformer(self.config.model_settings["model_name"], device=self.config.model_settings.get("device"))
+        if self.model.device.type == "cuda":
+            # fp16 inference; embeddings are still cached as float32
+            self.model.half()
+        self.encode_batch_size = self.config.model_settings.get("batch_size", 64)
         logging.info("Model loaded successfully.")
         
         self.cache_dir = Path("ai_pipeline/data/cache")
         model_name = self.config.model_settings.get("model_name", "default_model").replace("/", "_")
-        self.cache_file = self.cache_dir / f"embeddings_{model_name}.joblib"
+        self.cache_name = f"embeddings_{model_name}"
+        self.legacy_cache_file = self.cache_dir / f"{self.cache_name}.joblib"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         self._load_cache()
@@ -50,8 +72,7 @@ class SkillMatcher:
 
     def _load_json_file(self, path: Path) -> dict:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(path.read_bytes())
         except FileNotFoundError:
             logging.warning(f"Data file not found at {path}. Using empty dict.")
             return {}
@@ -60,53 +81,125 @@ class SkillMatcher:
             return {}
 
     def _load_cache(self):
-        if self.cache_file.exists():
+        self.embedding_cache = EmbeddingCache(self.cache_dir, self.cache_name)
+        if len(self.embedding_cache):
+            logging.info(f"Loaded {len(self.embedding_cache)} embeddings from cache.")
+        elif self.legacy_cache_file.exists():
+            # One-time import of the pickled dict cache used by older versions
             try:
-                self.embedding_cache = joblib.load(self.cache_file)
-                logging.info(f"Loaded {len(self.embedding_cache)} embeddings from cache.")
+                legacy_cache = joblib.load(self.legacy_cache_file)
+                if legacy_cache:
+                    self.embedding_cache.add(legacy_cache.keys(), np.stack([self._as_unit_vector(embedding) for embedding in legacy_cache.values()]))
+                    self._cache_dirty = True
+                    self._save_cache()
+                logging.info(f"Imported {len(self.embedding_cache)} embeddings from legacy cache.")
             except Exception as e:
                 logging.warning(f"Could not load cache file. Starting fresh. Error: {e}")
-                self.embedding_cache = {}
         else:
             logging.info("Cache file not found. Starting with an empty cache.")
 
+    @staticmethod
+    def _as_unit_vector(embedding: Any) -> np.ndarray:
+        # Caches written by older versions hold unnormalized torch tensors
+        if hasattr(embedding, "cpu"):
+            embedding = embedding.cpu().numpy()
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
     def _save_cache(self):
-        try:
-            joblib.dump(self.embedding_cache, self.cache_file)
-        except Exception as e:
-            logging.error(f"Error: Could not save cache file. Error: {e}")
+        with self._cache_lock:
+            self._save_timer = None
+            if not self._cache_dirty:
+                return
+            try:
+                self.embedding_cache.flush()
+                self._cache_dirty = False
+            except Exception as e:
+                logging.error(f"Error: Could not save cache file. Error: {e}")
+
+    def _schedule_cache_save(self):
+        # Called with _cache_lock held; one pending timer covers any number of inserts
+        self._cache_dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(_CACHE_SAVE_DELAY_SECONDS, self._save_cache)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def close(self):
+        timer = self._save_timer
+        if timer is not None:
+            timer.cancel()
+        self._save_cache()
 
     def __del__(self):
         try:
-            self._save_cache()
+            self.close()
         except Exception:
             pass
             
-    def _find_best_match(self, job_skill: str, candidate_skills: List[str], embedding_map: Dict[str, Any]) -> Dict[str, Any]:
+    def _encode_missing(self, texts: List[str]):
+        texts_to_encode = [text for text in dict.fromkeys(texts) if text not in self.embedding_cache]
+        if not texts_to_encode:
+            return
+        logging.info(f"Encoding {len(texts_to_encode)} unique skills in batch...")
+        new_embeddings = self.model.encode(
+            texts_to_encode,
+            batch_size=self.encode_batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        with self._cache_lock:
+            self.embedding_cache.add(texts_to_encode, new_embeddings)
+            self._schedule_cache_save()
+
+    def _embedding_matrix(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        # Fancy indexing copies, so the result stays valid if the cache grows later
+        return self.embedding_cache.take(self.embedding_cache.rows(texts))
+
+    def _semantic_similarity_matrix(self, part_matrix: np.ndarray, candidate_skills: List[str]) -> np.ndarray:
+        if not len(part_matrix) or not candidate_skills:
+            return np.zeros((len(part_matrix), len(candidate_skills)))
+        # Cached embeddings are unit vectors, so cosine similarity is a plain dot product
+        cand_matrix = self._embedding_matrix(candidate_skills)
+        return (part_matrix @ cand_matrix.T).astype(np.float64)
+
+    def _lexical_similarity_matrix(self, part_texts: List[str], candidate_skills: List[str]) -> np.ndarray:
+        if not part_texts or not candidate_skills:
+            return np.zeros((len(part_texts), len(candidate_skills)))
+        return self.normalizer.lexical_similarity_matrix(part_texts, candidate_skills)
+
+    def _best_candidate_per_part(self, semantic_matrix: np.ndarray, lexical_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        if semantic_matrix.shape[1] == 0:
+            empty = np.zeros(semantic_matrix.shape[0])
+            return {"index": empty.astype(np.intp), "score": empty, "semantic": empty, "lexical": empty}
+        scores = self.semantic_weight * semantic_matrix + self.lexical_weight * lexical_matrix
+        best_index = scores.argmax(axis=1)
+        rows = np.arange(scores.shape[0])
+        return {
+            "index": best_index,
+            "score": scores[rows, best_index],
+            "semantic": semantic_matrix[rows, best_index],
+            "lexical": lexical_matrix[rows, best_index]
+        }
+
+    def _find_best_match(self, job_skill: str, rows: List[int], candidate_skills: List[str], part_best: Dict[str, np.ndarray]) -> Dict[str, Any]:
         best_match = None
         best_score = 0
         best_semantic_sim = 0
         best_lexical_sim = 0
         
-        parts = [s.strip() for s in job_skill.split(" or ")]
-        
-        for part in parts:
-            part_embedding = embedding_map.get(part)
-            if part_embedding is None: continue
-            
-            for cand_skill in candidate_skills:
-                cand_embedding = embedding_map.get(cand_skill)
-                if cand_embedding is None: continue
-
-                semantic_sim = util.cos_sim(part_embedding, cand_embedding).item()
-                lexical_sim = self.normalizer.lexical_similarity(part, cand_skill)
-                score = self.semantic_weight * semantic_sim + self.lexical_weight * lexical_sim
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = cand_skill
-                    best_semantic_sim = semantic_sim
-                    best_lexical_sim = lexical_sim
+        if rows and candidate_skills:
+            # First part holding the maximum, as in the old part-major loop
+            row = rows[int(np.argmax(part_best["score"][rows]))]
+            if part_best["score"][row] > best_score:
+                best_score = float(part_best["score"][row])
+                best_match = candidate_skills[part_best["index"][row]]
+                best_semantic_sim = float(part_best["semantic"][row])
+                best_lexical_sim = float(part_best["lexical"][row])
 
         return {
             "skill": job_skill,
@@ -178,55 +271,105 @@ class SkillMatcher:
 
         return metadata
 
+    def compile_for_job(self, job_required: List[str], job_optional: List[str] = None) -> "JobMatcher":
+        return JobMatcher(self, job_required, job_optional)
+
     def match_skills(self, candidate_skills: List[str], job_required: List[str], job_optional: List[str] = None, candidate_source_type: str = "file_system", candidate_id: Any = "unknown_candidate", job_source_type: str = "file_system", job_id: Any = "unknown_job") -> Dict[str, Any]:
+        start_time = time.time()
+        try:
+            job_matcher = self.compile_for_job(job_required, job_optional)
+        except Exception as e:
+            # Job-side failures (bad skill entries, model errors) report like match errors
+            logging.error(f"An error occurred during matching: {e}")
+            metadata = self._generate_metadata(
+                candidate_source_type=candidate_source_type,
+                candidate_id=candidate_id,
+                job_source_type=job_source_type,
+                job_id=job_id,
+                processing_time=time.time() - start_time,
+                candidate_skills_list=candidate_skills,
+                job_required=job_required,
+                job_optional=job_optional or [],
+                results=None,
+                error_message=str(e)
+            )
+            return {"results": {}, "metadata": metadata}
+        return job_matcher.match(
+            candidate_skills,
+            candidate_source_type=candidate_source_type,
+            candidate_id=candidate_id,
+            job_source_type=job_source_type,
+            job_id=job_id
+        )
+
+
+class JobMatcher:
+    # Job-side work for one vacancy (" or " expansion, part embeddings) done once,
+    # so scoring many candidates against it only encodes the candidate side
+    def __init__(self, matcher: SkillMatcher, job_required: List[str], job_optional: List[str] = None):
+        self.matcher = matcher
+        self.job_required = list(job_required)
+        self.job_optional = list(job_optional or [])
+
+        # Each job skill expands to its " or " alternatives once; rows index into part_texts
+        self.job_skills = self.job_required + self.job_optional
+        self.part_texts = list(dict.fromkeys(s.strip() for skill in self.job_skills for s in skill.split(" or ")))
+        part_rows = {part: row for row, part in enumerate(self.part_texts)}
+        self.job_part_rows = [[part_rows[s.strip()] for s in skill.split(" or ")] for skill in self.job_skills]
+
+        matcher._encode_missing(self.part_texts)
+        self.part_matrix = matcher._embedding_matrix(self.part_texts)
+
+    def match(self, candidate_skills: List[str], candidate_source_type: str = "file_system", candidate_id: Any = "unknown_candidate", job_source_type: str = "file_system", job_id: Any = "unknown_job") -> Dict[str, Any]:
+        matcher = self.matcher
         start_time = time.time()
         results = None
-        
-        if job_optional is None:
-            job_optional = []
+        error_message = None
 
         try:
-            required_parts = []
-            for skill in job_required:
-                required_parts.extend([s.strip() for s in skill.split(" or ")])
-            
-            all_texts = list(set(candidate_skills + required_parts + job_optional))
-            
-            texts_to_encode = [text for text in all_texts if text not in self.embedding_cache]
-            if texts_to_encode:
-                logging.info(f"Encoding {len(texts_to_encode)} unique skills in batch...")
-                new_embeddings = self.model.encode(texts_to_encode, convert_to_tensor=True)
-                for text, embedding in zip(texts_to_encode, new_embeddings):
-                    self.embedding_cache[text] = embedding
-                self._save_cache()
-            
-            embedding_map = {text: self.embedding_cache[text] for text in all_texts}
+            if any(text not in matcher.embedding_cache for text in candidate_skills):
+                # Lexical scoring needs no embeddings, so it runs alongside the model
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    lexical_future = executor.submit(matcher._lexical_similarity_matrix, self.part_texts, candidate_skills)
+                    matcher._encode_missing(candidate_skills)
+                    lexical_matrix = lexical_future.result()
+            else:
+                lexical_matrix = matcher._lexical_similarity_matrix(self.part_texts, candidate_skills)
+
             logging.info("Starting skill matching...")
 
-            required_results = [self._find_best_match(skill, candidate_skills, embedding_map) for skill in job_required]
-            optional_results = [self._find_best_match(skill, candidate_skills, embedding_map) for skill in job_optional]
+            semantic_matrix = matcher._semantic_similarity_matrix(self.part_matrix, candidate_skills)
+            part_best = matcher._best_candidate_per_part(semantic_matrix, lexical_matrix)
+
+            job_results = [matcher._find_best_match(skill, rows, candidate_skills, part_best) for skill, rows in zip(self.job_skills, self.job_part_rows)]
+            required_results = job_results[:len(self.job_required)]
+            optional_results = job_results[len(self.job_required):]
+            req_sims = np.fromiter((r["sim"] for r in required_results), dtype=np.float64, count=len(required_results))
+            opt_sims = np.fromiter((r["sim"] for r in optional_results), dtype=np.float64, count=len(optional_results))
 
-            for res in optional_results:
-                res["ok"] = res["sim"] >= self.nice_threshold
+            nice_mask = opt_sims >= matcher.nice_threshold
+            for res, ok in zip(optional_results, nice_mask):
+                res["ok"] = bool(ok)
 
-            strong = [r for r in required_results if r["sim"] >= self.strong_threshold]
-            weak = [r for r in required_results if self.weak_threshold <= r["sim"] < self.strong_threshold]
-            missing = [r for r in required_results if r["sim"] < self.weak_threshold]
+            strong_mask = req_sims >= matcher.strong_threshold
+            missing_mask = req_sims < matcher.weak_threshold
+            weak_mask = ~strong_mask & ~missing_mask
+            strong = list(compress(required_results, strong_mask))
+            weak = list(compress(required_results, weak_mask))
+            missing = list(compress(required_results, missing_mask))
 
             summary = {
-                "req_strong": len(strong),
-                "req_weak": len(weak),
-                "req_missing": len(missing),
-                "nice_relevant": sum(1 for r in optional_results if r["ok"])
+                "req_strong": int(strong_mask.sum()),
+                "req_weak": int(weak_mask.sum()),
+                "req_missing": int(missing_mask.sum()),
+                "nice_relevant": int(nice_mask.sum())
             }
 
-            req_scores = [r["sim"] for r in required_results]
-            required_match_score = np.mean(req_scores) if req_scores else 0
-            opt_scores = [r["sim"] for r in optional_results]
-            optional_match_score = np.mean(opt_scores) if opt_scores else 0
+            required_match_score = req_sims.mean() if req_sims.size else 0
+            optional_match_score = opt_sims.mean() if opt_sims.size else 0
             skill_component_score = (
-                self.required_skill_relative_weight * required_match_score + 
-                self.optional_skill_relative_weight * optional_match_score
+                matcher.required_skill_relative_weight * required_match_score + 
+                matcher.optional_skill_relative_weight * optional_match_score
             )
             
             results = {
@@ -241,27 +384,28 @@ class SkillMatcher:
                 "nice": optional_results,
                 "summary": summary,
                 "relative_skill_weights": {
-                    "required": round(self.required_skill_relative_weight, 4),
-                    "optional": round(self.optional_skill_relative_weight, 4)
+                    "required": round(matcher.required_skill_relative_weight, 4),
+                    "optional": round(matcher.optional_skill_relative_weight, 4)
                 }
             }
             
         except Exception as e:
             logging.error(f"An error occurred during matching: {e}")
+            error_message = str(e)
 
         finally:
             end_time = time.time()
             processing_time = end_time - start_time
-            metadata = self._generate_metadata(
+            metadata = matcher._generate_metadata(
                 candidate_source_type=candidate_source_type, # <--- TERUSKAN
                 candidate_id=candidate_id,
                 job_source_type=job_source_type, # <--- TERUSKAN
                 job_id=job_id,
                 processing_time=processing_time,
                 candidate_skills_list=candidate_skills,
-                job_required=job_required,
-                job_optional=job_optional,
+                job_required=self.job_required,
+                job_optional=self.job_optional,
                 results=results,
-                error_message=str(e) if results is None else None
+                error_message=error_message
             )
             return {"results": results or {}, "metadata": metadata}
\ No newline at end of file
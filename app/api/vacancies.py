@@ -1,7 +1,9 @@
 # app/api/vacancies.py
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import case, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 from fastapi import Request
 from typing import Dict, Any, List
 from fastapi.templating import Jinja2Templates
@@ -13,61 +15,85 @@ from app.models import Vacancy, Weight
 router = APIRouter(tags=["Vacancies"])
 templates = Jinja2Templates(directory="backend/app/templates")
 
-@router.get("/")
-def list_vacancies(request: Request, db: Session = Depends(get_db)):
-    vacancies = db.query(Vacancy).all()
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+async def _render_vacancy_page(request: Request, db: AsyncSession, page: int, size: int):
+    total = await db.scalar(select(func.count(Vacancy.seq_id)))
+    result = await db.execute(
+        select(Vacancy)
+        # The cards need no relationships
+        .options(raiseload("*"))
+        .order_by(Vacancy.seq_id)
+        .limit(size)
+        .offset((page - 1) * size)
+    )
+    vacancies = result.scalars().all()
     return templates.TemplateResponse(
         "vacancies.html",
-        {"request": request, "vacancies": vacancies}
+        {"request": request, "vacancies": vacancies, "page": page, "size": size, "total": total}
     )
+
+@router.get("/")
+async def list_vacancies(
+    request: Request,
+    page: int = Query(1, ge=1),
+    size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    return await _render_vacancy_page(request, db, page, size)
     
-@router.post("/", response_model=VacancyResponse)
-def create_vacancy_api(vacancy_data: VacancyCreate, db: Session = Depends(get_db)):
+# to_dict already has the VacancyResponse shape; the schema only documents it
+@router.post("/", responses={200: {"model": VacancyResponse}})
+async def create_vacancy_api(vacancy_data: VacancyCreate, db: AsyncSession = Depends(get_db)):
     try:
-        new_vacancy = create_vacancy(db=db, vacancy_data=vacancy_data)
+        new_vacancy = await create_vacancy(db=db, vacancy_data=vacancy_data)
         return new_vacancy.to_dict()
     except Exception as e:
         print(f"Error creating vacancy: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating vacancy: {e}")
 
 @router.get("/add")
-def add_vacancy_form(request: Request):
+async def add_vacancy_form(request: Request):
     return templates.TemplateResponse("add_vacancy.html", {
         "request": request
 })
     
 @router.post("/{vacancy_id}/toggle_status")
-def toggle_vacancy_status(vacancy_id: str, db: Session = Depends(get_db)):
-    vacancy = db.query(Vacancy).filter(Vacancy.id == vacancy_id).first()
-    if not vacancy:
+async def toggle_vacancy_status(vacancy_id: str, db: AsyncSession = Depends(get_db)):
+    # Flip the status server-side in one statement
+    stmt = (
+        update(Vacancy)
+        .where(Vacancy.id == vacancy_id)
+        .values(status=case((func.lower(Vacancy.status) == "active", "inactive"), else_="active"))
+        .returning(Vacancy.id, Vacancy.status)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Vacancy not found")
-    if vacancy.status.lower() == "active":
-        vacancy.status = "inactive"
-    else:
-        vacancy.status = "active"
-    db.commit()
-    db.refresh(vacancy)
-    return {"id": vacancy.id, "new_status": vacancy.status}
+    await db.commit()
+    return {"id": row.id, "new_status": row.status}
 
 @router.get("/vacancies")
-def list_vacancies(request: Request, db=Depends(get_db)):
-    vacancies = db.query(Vacancy).all()
-    return templates.TemplateResponse(
-        "vacancies.html",
-        {"request": request, "vacancies": vacancies}
-    )
+async def list_vacancies_alias(
+    request: Request,
+    page: int = Query(1, ge=1),
+    size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    return await _render_vacancy_page(request, db, page, size)
 
 @router.post("/vacancy-weights/", response_model=Dict[str, Any])
-def create_vacancy_weights(
+async def create_vacancy_weights(
     weights: WeightCreate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    vacancy = db.query(Vacancy).filter(Vacancy.id == weights.vacancy_id).first()
-    if not vacancy:
+    vacancy_exists = await db.scalar(select(Vacancy.seq_id).filter(Vacancy.id == weights.vacancy_id))
+    if vacancy_exists is None:
         raise HTTPException(status_code=404, detail="Vacancy not found")
     
-    # Create new weights record
-    db_weights = Weight(
+    # Create new weights record, reading the generated id back from the INSERT
+    stmt = insert(Weight).values(
         vacancy_id=weights.vacancy_id,
         education_weight=weights.education_weight,
         experience_weight=weights.experience_weight,
@@ -75,17 +101,22 @@ def create_vacancy_weights(
         certifications_weight=weights.certifications_weight,
         required_skills_weight=weights.required_skills_weight,
         optional_skills_weight=weights.optional_skills_weight
-    )
+    ).returning(Weight.id)
+    weights_id = await db.scalar(stmt)
+    await db.commit()
     
-    db.add(db_weights)
-    db.commit()
-    db.refresh(db_weights)
-    
-    return {"id": db_weights.id, "message": "Weights created successfully"}
+    return {"id": weights_id, "message": "Weights created successfully"}
 
 @router.get("/{public_id}")
-def recruiter_get(request: Request, public_id: str, db: Session = Depends(get_db)):
-    vacancy = db.query(Vacancy).filter_by(public_id=public_id).first()
+async def recruiter_get(request: Request, public_id: str, db: AsyncSession = Depends(get_db)):
+    # details.html renders the weights (score cards and the weights modal defaults) as
+    # `weights`; an AsyncSession cannot lazy-load vacancy.weight during rendering
+    result = await db.execute(
+        select(Vacancy)
+        .options(joinedload(Vacancy.weight))
+        .filter_by(public_id=public_id)
+    )
+    vacancy = result.scalars().first()
     if not vacancy:
         raise HTTPException(404, "Vacancy not found")
     return templates.TemplateResponse(
@@ -1,19 +1,24 @@
 # app/crud.py
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import Vacancy, VacancyCertifications, VacancyOptionalSkills, VacancyRequiredSkills, VacancyResponsibilities
+from app.models import Vacancy
 from app.schemas import VacancyCreate
 
 logger = logging.getLogger(__name__)
 
 # Vacancy CRUD
-def create_vacancy(db: Session, vacancy_data: VacancyCreate):
+async def create_vacancy(db: AsyncSession, vacancy_data: VacancyCreate):
     vacancy = Vacancy(
         job_position = vacancy_data.job_position,
         job_description = vacancy_data.job_description,
         department = vacancy_data.department,
+        responsibilities = vacancy_data.responsibilities,
+        certifications = vacancy_data.certification_requirements or [],
+        required_skills = vacancy_data.required_skills,
+        optional_skills = vacancy_data.optional_skills or [],
         education_requirements = vacancy_data.education_requirements,
         experience_level = vacancy_data.experience_level,
         min_years_experience = vacancy_data.min_years_experience,
@@ -26,26 +31,15 @@ def create_vacancy(db: Session, vacancy_data: VacancyCreate):
         status = vacancy_data.status
     )
     db.add(vacancy)
-    db.flush()
+    await db.commit()
+    # Reload for the server defaults, since lazy loads are unavailable on AsyncSession
+    return await get_vacancy(db, vacancy.id)
 
-    for item in vacancy_data.responsibilities:
-        db.add(VacancyResponsibilities(vacancy_id=vacancy.id, responsibility=item))
 
-    if vacancy_data.certification_requirements:
-        for cert in vacancy_data.certification_requirements:
-            db.add(VacancyCertifications(vacancy_id=vacancy.id, certification=cert))
-
-    for skill in vacancy_data.required_skills:
-        db.add(VacancyRequiredSkills(vacancy_id=vacancy.id, skill=skill))
-
-    if vacancy_data.optional_skills:
-        for skill in vacancy_data.optional_skills:
-            db.add(VacancyOptionalSkills(vacancy_id=vacancy.id, skill=skill))
-
-    db.commit()
-    db.refresh(vacancy)
-    return vacancy
-
-
-def get_vacancy(db: Session, vacancy_id: str):
-    return db.query(Vacancy).filter(Vacancy.id == vacancy_id).first()
\ No newline at end of file
+async def get_vacancy(db: AsyncSession, vacancy_id: str):
+    result = await db.execute(
+        select(Vacancy)
+        .filter(Vacancy.id == vacancy_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
@@ -4,14 +4,22 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
+import os
 from app.database import Base, engine
 from . import models
 from app.api.vacancies import router as vacancies_router
 
+try:
+    import orjson
+    _default_response_class = ORJSONResponse
+except ImportError:
+    _default_response_class = JSONResponse
+
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI(title="Cognitive Resume Screening API")
+app = FastAPI(title="Cognitive Resume Screening API", default_response_class=_default_response_class)
 templates = Jinja2Templates(directory="backend/app/templates")
 app.mount("/static", StaticFiles(directory="backend/app/static"), name="static")
 
@@ -25,11 +33,14 @@ app.mount("/static", StaticFiles(directory="backend/app/static"), name="static")
 # )
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     logging.info("[APP] Starting FastAPI application...")
-    logging.info("[DB] Creating all database tables if not present...")
-    Base.metadata.create_all(bind=engine)
-    logging.info("[DB] Database ready.")
+    # Schema creation is a deploy-time step; only the process started with RUN_MIGRATIONS=1 does it
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        logging.info("[DB] Creating all database tables if not present...")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        logging.info("[DB] Database ready.")
 
 # Root endpoint
 @app.get("/")
@@ -0,0 +1,28 @@
+-- One-shot migration: fold the per-item child tables into TEXT[] columns on vacancy.
+BEGIN;
+
+ALTER TABLE vacancy
+    ADD COLUMN IF NOT EXISTS responsibilities TEXT[] NOT NULL DEFAULT '{}',
+    ADD COLUMN IF NOT EXISTS certifications TEXT[] NOT NULL DEFAULT '{}',
+    ADD COLUMN IF NOT EXISTS required_skills TEXT[] NOT NULL DEFAULT '{}',
+    ADD COLUMN IF NOT EXISTS optional_skills TEXT[] NOT NULL DEFAULT '{}';
+
+UPDATE vacancy v SET responsibilities = c.items
+FROM (SELECT vacancy_id, array_agg(responsibility ORDER BY id) AS items FROM vacancy_responsibilities GROUP BY vacancy_id) c
+WHERE c.vacancy_id = v.id;
+
+UPDATE vacancy v SET certifications = c.items
+FROM (SELECT vacancy_id, array_agg(certification ORDER BY id) AS items FROM vacancy_certifications GROUP BY vacancy_id) c
+WHERE c.vacancy_id = v.id;
+
+UPDATE vacancy v SET required_skills = c.items
+FROM (SELECT vacancy_id, array_agg(skill ORDER BY id) AS items FROM vacancy_required_skills GROUP BY vacancy_id) c
+WHERE c.vacancy_id = v.id;
+
+UPDATE vacancy v SET optional_skills = c.items
+FROM (SELECT vacancy_id, array_agg(skill ORDER BY id) AS items FROM vacancy_optional_skills GROUP BY vacancy_id) c
+WHERE c.vacancy_id = v.id;
+
+DROP TABLE vacancy_responsibilities, vacancy_certifications, vacancy_required_skills, vacancy_optional_skills;
+
+COMMIT;
@@ -0,0 +1,4 @@
+-- Composite indexes for dashboard filters; the candidate PK already has its own unique index.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_candidate_vac_status ON candidate (vacancy_id, status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vacancy_status_deadline ON vacancy (status, application_deadline);
+DROP INDEX CONCURRENTLY IF EXISTS ix_candidate_id;
@@ -0,0 +1,2 @@
+-- Let Postgres format vacancy.id in the INSERT instead of a separate nextval round-trip.
+ALTER TABLE vacancy ALTER COLUMN id SET DEFAULT 'VAC-' || LPAD(nextval('job_vacancy_seq')::text, 5, '0');
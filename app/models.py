@@ -1,6 +1,7 @@
 # app/models.py
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, TIMESTAMP, Sequence
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, TIMESTAMP, Sequence, Index
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from app.database import Base
 from sqlalchemy.sql import func
@@ -12,7 +13,8 @@ from nanoid import generate
 
 class Candidate(Base):
     __tablename__ = "candidate"
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (Index("ix_candidate_vac_status", "vacancy_id", "status"),)
+    id = Column(Integer, primary_key=True)
     full_name = Column(Text, nullable=False)
     email = Column(Text, nullable=False)
     phone = Column(Text)
@@ -30,8 +32,10 @@ class Candidate(Base):
     
 class Vacancy(Base):
     __tablename__ = "vacancy"
+    __table_args__ = (Index("ix_vacancy_status_deadline", "status", "application_deadline"),)
     seq_id = Column(Integer, Sequence('job_vacancy_seq', start=1, increment=1), primary_key=True)
-    id = Column(String, unique=True, index=True, nullable=False)
+    # Formatted by Postgres in the INSERT itself and read back via RETURNING
+    id = Column(String, unique=True, index=True, nullable=False, server_default=text("'VAC-' || LPAD(nextval('job_vacancy_seq')::text, 5, '0')"))
     public_id = Column(String(16), unique=True, index=True, nullable=False)
     job_position = Column(Text, nullable=False)
     job_description = Column(Text, nullable=False)
@@ -47,6 +51,11 @@ class Vacancy(Base):
     application_deadline = Column(TIMESTAMP)
     max_applicants = Column(Integer)
     posting_date = Column(TIMESTAMP, server_default=func.now())
+    # Plain string lists, stored inline instead of in per-item child tables
+    responsibilities = Column(ARRAY(Text), nullable=False, server_default="{}")
+    certifications = Column(ARRAY(Text), nullable=False, server_default="{}")
+    required_skills = Column(ARRAY(Text), nullable=False, server_default="{}")
+    optional_skills = Column(ARRAY(Text), nullable=False, server_default="{}")
     num_applicants = column_property(
         select(func.count(Candidate.id))
         .where(Candidate.vacancy_id == id)
@@ -56,18 +65,9 @@ class Vacancy(Base):
     # Relationships
     candidates = relationship("Candidate", back_populates="vacancy")
     weight = relationship("Weight", back_populates="vacancy", uselist=False)
-    responsibilities = relationship("VacancyResponsibilities", cascade="all, delete-orphan", back_populates="vacancy")
-    certifications = relationship("VacancyCertifications", cascade="all, delete-orphan", back_populates="vacancy")
-    required_skills = relationship("VacancyRequiredSkills", cascade="all, delete-orphan", back_populates="vacancy")
-    optional_skills = relationship("VacancyOptionalSkills", cascade="all, delete-orphan", back_populates="vacancy")
 
     @staticmethod
     def generate_id(mapper, connection, target):
-        if not target.id:
-            result = connection.execute(text("SELECT nextval('job_vacancy_seq')"))
-            seq_number = result.scalar()
-            target.id = f"VAC-{seq_number:05d}"
-        
         if not target.public_id:
             target.public_id = generate(size=12)
             
@@ -78,10 +78,10 @@ class Vacancy(Base):
             "job_description": self.job_description,
             "department": self.department,
 
-            "responsibilities": [r.responsibility for r in self.responsibilities],
-            "certifications": [c.certification for c in self.certifications],
-            "required_skills": [s.skill for s in self.required_skills],
-            "optional_skills": [s.skill for s in self.optional_skills],
+            "responsibilities": self.responsibilities,
+            "certifications": self.certifications,
+            "required_skills": self.required_skills,
+            "optional_skills": self.optional_skills,
 
             "education_requirements": self.education_requirements,
             "experience_level": self.experience_level,
@@ -91,40 +91,12 @@ class Vacancy(Base):
             "salary_min": self.salary_min,
             "salary_max": self.salary_max,
             "status": self.status,
-            "application_deadline": self.application_deadline,
+            # Stored as a timestamp but exposed as the date it was entered as
+            "application_deadline": self.application_deadline.date() if self.application_deadline else None,
             "posting_date": self.posting_date,
         }
 event.listen(Vacancy, 'before_insert', Vacancy.generate_id)
 
-class VacancyResponsibilities(Base):
-    __tablename__ = "vacancy_responsibilities"
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    vacancy_id = Column(String, ForeignKey("vacancy.id"), nullable=False)
-    responsibility = Column(Text, nullable=False)
-    vacancy = relationship("Vacancy", back_populates="responsibilities")
-
-class VacancyCertifications(Base):
-    __tablename__ = "vacancy_certifications"
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    vacancy_id = Column(String, ForeignKey("vacancy.id"), nullable=False)
-    certification = Column(Text, nullable=False)
-    vacancy = relationship("Vacancy", back_populates="certifications")
-
-class VacancyRequiredSkills(Base):
-    __tablename__ = "vacancy_required_skills"
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    vacancy_id = Column(String, ForeignKey("vacancy.id"), nullable=False)
-    skill = Column(Text, nullable=False)
-    vacancy = relationship("Vacancy", back_populates="required_skills")
-
-class VacancyOptionalSkills(Base):
-    __tablename__ = "vacancy_optional_skills"
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    vacancy_id = Column(String, ForeignKey("vacancy.id"), nullable=False)
-    skill = Column(Text, nullable=False)
-    vacancy = relationship("Vacancy", back_populates="optional_skills")
-
-
 class Weight(Base):
     __tablename__ = "weight"
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -1,6 +1,6 @@
 # app/schemas.py
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List
 from datetime import date, datetime
 
@@ -22,13 +22,11 @@ class VacancyCreate(BaseModel):
     application_deadline: date
     max_applicants: Optional[int] = Field(None, ge=0)
     status: str = "active"
-    @validator('salary_max')
-    def salary_must_be_greater_than_min(cls, v, values):
-        if 'salary_min' in values and v <= values['salary_min']:
+    @model_validator(mode='after')
+    def salary_must_be_greater_than_min(self):
+        if self.salary_max <= self.salary_min:
             raise ValueError('salary_max must be greater than salary_min')
-        return v
-    class Config:
-        orm_mode = True
+        return self
 
 
 class WeightCreate(BaseModel):
@@ -39,8 +37,6 @@ class WeightCreate(BaseModel):
     certifications_weight: float
     required_skills_weight: float
     optional_skills_weight: float
-    class Config:
-        orm_mode = True
 
 
 class VacancyResponse(BaseModel):
@@ -63,4 +59,4 @@ class VacancyResponse(BaseModel):
     application_deadline: date
     posting_date: Optional[datetime]
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file